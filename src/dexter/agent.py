@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from langchain_core.messages import AIMessage
 from langsmith import traceable, trace
 
 from dexter.model import (
     call_llm,
+    call_llm_batched,
     call_llm_stream,
     DEFAULT_MODEL_PROVIDER,
     MODEL_PROVIDER,
@@ -18,7 +19,7 @@ from dexter.prompts import (
     META_VALIDATION_SYSTEM_PROMPT,
 )
 from dexter.schemas import IsDone, OptimizedToolArgs, Task, TaskList
-from dexter.tools import TOOLS
+from dexter.tools import get_tools
 from dexter.utils.logger import Logger
 from dexter.utils.ui import show_progress
 from dexter.utils.context import ContextManager
@@ -44,7 +45,10 @@ class Agent:
     def plan_tasks(self, query: str) -> List[Task]:
         with trace(name="task_planning"):
             tool_descriptions = "\n".join(
-                [f"- {t.name}: {t.description}" for t in TOOLS[self.data_source]]
+                [
+                    f"- {t.name}: {t.description}"
+                    for t in get_tools(self.data_source)
+                ]
             )
             prompt = f"""
             Given the user query: "{query}",
@@ -87,7 +91,7 @@ class Agent:
                 return call_llm(
                     prompt,
                     system_prompt=ACTION_SYSTEM_PROMPT,
-                    tools=TOOLS[self.data_source],
+                    tools=get_tools(self.data_source),
                     model=self.model,
                 )
             except Exception as e:
@@ -162,29 +166,28 @@ class Agent:
                 return False
 
     # ---------- optimize tool arguments ----------
-    @show_progress("Optimizing tool call...", "")
-    def optimize_tool_args(
+    def _tool_args_prompt(
         self, tool_name: str, initial_args: dict, task_desc: str
-    ) -> dict:
-        """Optimize tool arguments based on task requirements."""
-        with trace(name="optimize_tool_args"):
-            tool = next(
-                (t for t in TOOLS[self.data_source] if t.name == tool_name), None
-            )
-            if not tool:
-                return initial_args
-
-            # Get tool schema info
-            tool_description = tool.description
-            tool_schema = (
-                tool.args_schema.model_json_schema()
-                if hasattr(tool, "args_schema")
-                and tool.args_schema
-                and isinstance(tool.args_schema, type)
-                else {}
-            )
-
-            prompt = f"""
+    ) -> Optional[str]:
+        """Build the argument optimization prompt, or None for unknown tools."""
+        tool = next(
+            (t for t in get_tools(self.data_source) if t.name == tool_name),
+            None,
+        )
+        if not tool:
+            return None
+
+        # Get tool schema info
+        tool_description = tool.description
+        tool_schema = (
+            tool.args_schema.model_json_schema()
+            if hasattr(tool, "args_schema")
+            and tool.args_schema
+            and isinstance(tool.args_schema, type)
+            else {}
+        )
+
+        return f"""
             Task: "{task_desc}"
             Tool: {tool_name}
             Tool Description: {tool_description}
@@ -196,6 +199,17 @@ class Agent:
             Do not nest the arguments, for example, if the task is to retrieve ttm and annual filings, and the tool args only allow for a single period, set period to either 'ttm' or 'annual' but not both.
             Return the optimized arguments in JSON format.
             """
+
+    @show_progress("Optimizing tool call...", "")
+    def optimize_tool_args(
+        self, tool_name: str, initial_args: dict, task_desc: str
+    ) -> dict:
+        """Optimize tool arguments based on task requirements."""
+        with trace(name="optimize_tool_args"):
+            prompt = self._tool_args_prompt(tool_name, initial_args, task_desc)
+            if prompt is None:
+                return initial_args
+
             try:
                 response = call_llm(
                     prompt,
@@ -213,6 +227,64 @@ class Agent:
                 )
                 return initial_args
 
+    def optimize_tool_args_batch(self, tool_calls: list, task_desc: str) -> List[dict]:
+        """
+        Optimize the arguments of several tool calls in one LLM request.
+
+        Falls back to optimizing each call individually if the batched
+        request fails.
+        """
+        if len(tool_calls) == 1:
+            tool_call = tool_calls[0]
+            return [
+                self.optimize_tool_args(tool_call["name"], tool_call["args"], task_desc)
+            ]
+
+        # Calls to unknown tools keep their original args
+        optimized = [tool_call["args"] for tool_call in tool_calls]
+        pending = []
+        for i, tool_call in enumerate(tool_calls):
+            prompt = self._tool_args_prompt(
+                tool_call["name"], tool_call["args"], task_desc
+            )
+            if prompt is not None:
+                pending.append((i, prompt))
+        if not pending:
+            return optimized
+
+        @show_progress(f"Optimizing {len(pending)} tool calls...", "")
+        def run_batch():
+            return call_llm_batched(
+                [prompt for _, prompt in pending],
+                output_schema=OptimizedToolArgs,
+                system_prompt=get_tool_args_system_prompt(),
+                model=self.model,
+            )
+
+        with trace(name="optimize_tool_args_batch"):
+            try:
+                responses = run_batch()
+            except Exception as e:
+                self.logger._log(
+                    f"Batched argument optimization failed: {e}, optimizing individually"
+                )
+                return [
+                    self.optimize_tool_args(
+                        tool_call["name"], tool_call["args"], task_desc
+                    )
+                    for tool_call in tool_calls
+                ]
+
+        for (i, _), response in zip(pending, responses):
+            arguments = (
+                response.get("arguments")  # type: ignore[union-attr]
+                if isinstance(response, dict)
+                else response.arguments  # type: ignore[attr-defined]
+            )
+            if arguments:
+                optimized[i] = arguments
+        return optimized
+
     # ---------- tool execution ----------
     def _execute_tool(self, tool, tool_name: str, inp_args):
         """Execute a tool with progress indication."""
@@ -311,18 +383,26 @@ class Agent:
                             self.logger.log_task_done(task.description)
                             break
 
+                        # Only the calls that fit in the remaining step budget
+                        # are executed, so only those are optimized.
+                        tool_calls = ai_message.tool_calls[
+                            : self.max_steps - step_count
+                        ]
+
+                        # Refine tool arguments for better performance,
+                        # batching all tool calls into a single LLM request.
+                        optimized_args_list = self.optimize_tool_args_batch(
+                            tool_calls, task.description
+                        )
+
                         # Process each tool call returned by the LLM.
-                        for tool_call in ai_message.tool_calls:
+                        for tool_call, optimized_args in zip(
+                            tool_calls, optimized_args_list
+                        ):
                             if step_count >= self.max_steps:
                                 break
 
                             tool_name = tool_call["name"]
-                            initial_args = tool_call["args"]
-
-                            # Refine tool arguments for better performance.
-                            optimized_args = self.optimize_tool_args(
-                                tool_name, initial_args, task.description
-                            )
 
                             # Create a signature of the action to be taken.
                             action_sig = f"{tool_name}:{optimized_args}"
@@ -343,7 +423,7 @@ class Agent:
                             tool_to_run = next(
                                 (
                                     t
-                                    for t in TOOLS[self.data_source]
+                                    for t in get_tools(self.data_source)
                                     if t.name == tool_name
                                 ),
                                 None,
@@ -1,9 +1,9 @@
-from dotenv import load_dotenv
+from dexter.utils.config import load_dotenv_if_needed
 
 # Load environment variables
-load_dotenv()
+load_dotenv_if_needed()
 
-from typing import Optional
+from typing import Callable, Optional
 
 from dexter.agent import Agent
 from dexter.utils.intro import print_intro
@@ -13,6 +13,39 @@ from dexter.utils.env import ensure_api_key_for_model_provider
 from dexter.utils.config import get_setting, set_setting
 from dexter.model import DEFAULT_MODEL_PROVIDER, MODEL_PROVIDER
 
+# ANSI escape codes for status messages
+_MODEL_COLOR = "\033[38;2;88;166;255m"
+_RESET = "\033[0m"
+
+
+def _handle_model_change(
+    current_model_provider: MODEL_PROVIDER,
+) -> Optional[MODEL_PROVIDER]:
+    """Let the user pick a model provider. Returns None if nothing changed."""
+    selected_model_provider: Optional[MODEL_PROVIDER] = select_model_provider(current_model_provider)  # type: ignore
+    if not selected_model_provider:
+        return None
+
+    # Check and prompt for API key if needed
+    if not ensure_api_key_for_model_provider(selected_model_provider):
+        print(
+            f"\n✗ Cannot use model provider {selected_model_provider} without API key. Please try again.\n"
+        )
+        return None
+
+    set_setting("model", selected_model_provider)
+    print(
+        f"\n✓ Model provider changed to {_MODEL_COLOR}{selected_model_provider}{_RESET}\n"
+    )
+    return selected_model_provider
+
+
+# Slash commands take the current model provider and return the newly selected
+# one (which starts a fresh agent), or None to keep the current agent.
+_SLASH_COMMANDS: dict[str, Callable[[MODEL_PROVIDER], Optional[MODEL_PROVIDER]]] = {
+    "/model": _handle_model_change,
+}
+
 
 def main():
     print_intro()
@@ -33,22 +66,13 @@ def main():
                 print("Goodbye!")
                 break
             if query:
-                # Check if user wants to change model
-                if query.strip() == "/model":
-                    selected_model_provider: Optional[MODEL_PROVIDER] = select_model_provider(current_model_provider)  # type: ignore
+                # Check if user entered a slash command
+                handler = _SLASH_COMMANDS.get(query.strip())
+                if handler:
+                    selected_model_provider = handler(current_model_provider)
                     if selected_model_provider:
-                        # Check and prompt for API key if needed
-                        if ensure_api_key_for_model_provider(selected_model_provider):
-                            current_model_provider = selected_model_provider
-                            set_setting("model", current_model_provider)
-                            agent = Agent(model=current_model_provider)
-                            print(
-                                f"\n✓ Model provider changed to \033[38;2;88;166;255m{selected_model_provider}\033[0m\n"
-                            )
-                        else:
-                            print(
-                                f"\n✗ Cannot use model provider {selected_model_provider} without API key. Please try again.\n"
-                            )
+                        current_model_provider = selected_model_provider
+                        agent = Agent(model=current_model_provider)
                     continue
 
                 try:
@@ -1,33 +1,57 @@
+import hashlib
 import os
+import random
 import time
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel, Field, SecretStr, create_model
 from typing import Iterator, List, Literal, Optional, Type
 from langchain_core.tools import BaseTool
 from langchain_core.messages import AIMessage
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
 
-from openai import APIConnectionError
+from openai import APIConnectionError, InternalServerError, RateLimitError
 
 from dexter.prompts import DEFAULT_SYSTEM_PROMPT
+from dexter.utils.llm_cache import (
+    cache_response,
+    get_cached_response,
+    is_llm_cache_enabled,
+    make_cache_key,
+)
 
 DEFAULT_MODEL_TYPE = "standard"  # strong or standard
 DEFAULT_MODEL_PROVIDER = "openai"  # openai, anthropic, gemini
 MODEL_PROVIDER = Literal["openai", "anthropic", "gemini"]
 
+# Transient provider errors worth retrying. Other API errors (4xx such as auth
+# or bad request) are not retryable and propagate immediately.
+# APITimeoutError is a subclass of APIConnectionError.
+RETRYABLE_ERRORS = (APIConnectionError, InternalServerError, RateLimitError)
+MAX_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 4.0
+
 
+@lru_cache(maxsize=16)
 def get_chat_model(
     model: MODEL_PROVIDER = DEFAULT_MODEL_PROVIDER,
     model_type: str = DEFAULT_MODEL_TYPE,
     temperature: float = 0,
     streaming: bool = False,
+    prompt_cache_key: Optional[str] = None,
 ) -> BaseChatModel:
     """
     Factory function to get the appropriate chat model based on the llm type.
+
+    ``prompt_cache_key`` is forwarded to OpenAI so requests sharing a system
+    prompt are routed to the same prompt cache.
+
+    Instances are cached per argument tuple so the underlying HTTP client (and
+    its connection pool) is reused across calls. Call
+    ``get_chat_model.cache_clear()`` after API keys or model env vars change.
     """
     api_key = os.getenv(f"LLM_API_{model.upper()}_KEY")
     if not api_key:
@@ -40,8 +64,11 @@ def get_chat_model(
         "gpt-5-mini",
     )
 
-    if model == "claude":
+    # Provider SDKs are imported lazily so only the selected one is loaded
+    if model == "anthropic":
         # Anthropic models
+        from langchain_anthropic import ChatAnthropic
+
         return ChatAnthropic(
             model_name=model_name,
             temperature=temperature,
@@ -53,6 +80,8 @@ def get_chat_model(
 
     elif model == "gemini":
         # Google Gemini models
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         return ChatGoogleGenerativeAI(
             model=model_name,
             temperature=temperature,
@@ -65,12 +94,139 @@ def get_chat_model(
         # Default to OpenAI (gpt-* or others)
         # OpenAI client handles reading OPENAI_API_KEY from env automatically if not passed,
         # but we pass it explicitly to match existing pattern if set.
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=model_name,
             temperature=temperature,
             api_key=SecretStr(api_key),
             streaming=streaming,
+            extra_body=(
+                {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None
+            ),
+        )
+
+
+@lru_cache(maxsize=32)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Return a stable (cross-process) identifier for a system prompt."""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:32]
+
+
+@lru_cache(maxsize=32)
+def _get_template(system_prompt: str, model: MODEL_PROVIDER) -> ChatPromptTemplate:
+    """Return the (shared) prompt template for a system prompt and provider."""
+    # The system prompt stays a template entry so its escaped braces are
+    # formatted the same way for every provider
+    if model == "anthropic":
+        system_template = [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+    else:
+        system_template = system_prompt
+
+    return ChatPromptTemplate.from_messages(
+        [("system", system_template), ("user", "{prompt}")]
+    )
+
+
+def _build_llm(
+    system_prompt: str,
+    model: MODEL_PROVIDER,
+    model_type: str,
+    streaming: bool,
+) -> tuple[BaseChatModel, ChatPromptTemplate]:
+    """
+    Build the chat model and prompt template with provider-side prompt caching.
+
+    The system prompt is always the first message and takes no per-call
+    variables, so it forms a stable prefix that providers can cache:
+      - OpenAI caches stable prefixes automatically; the prompt cache key keeps
+        calls sharing a system prompt on the same cache.
+      - Anthropic requires the prefix to be marked with ``cache_control``.
+      - Gemini applies implicit caching to repeated prefixes.
+
+    Dynamic content must stay at the tail of the template (the user turn),
+    otherwise the cached prefix is invalidated on every call.
+    """
+    llm = get_chat_model(
+        model=model,
+        model_type=model_type,
+        temperature=0,
+        streaming=streaming,
+        prompt_cache_key=(
+            _prompt_cache_key(system_prompt) if model == "openai" else None
+        ),
+    )
+
+    return llm, _get_template(system_prompt, model)
+
+
+# Structured-output / tool-bound runnables keyed by (id(llm), ...). The llm
+# itself is stored alongside so a recycled id of an evicted model is detected.
+_MAX_BOUND_RUNNABLES = 64
+_bound_runnables: dict[tuple, tuple[BaseChatModel, Runnable]] = {}
+
+
+def _get_bound_runnable(
+    llm: BaseChatModel,
+    output_schema: Optional[Type[BaseModel]] = None,
+    tools: Optional[List[BaseTool]] = None,
+) -> Runnable:
+    """
+    Return llm with structured output or tools bound, reusing earlier bindings.
+
+    Binding serializes every tool/schema into the provider's function-calling
+    format, so it is done once per (llm, schema) or (llm, tool set).
+    """
+    if output_schema:
+        # For tool argument optimization, we don't need the full message
+        method = (
+            "json_mode"
+            if output_schema.__name__ == "OptimizedToolArgs"
+            else "function_calling"
         )
+        key: tuple = (id(llm), output_schema, method)
+    elif tools:
+        key = (id(llm), tuple(t.name for t in tools))
+    else:
+        return llm
+
+    cached = _bound_runnables.get(key)
+    if cached is not None and cached[0] is llm:
+        return cached[1]
+
+    if output_schema:
+        runnable = llm.with_structured_output(output_schema, method=method)
+    else:
+        runnable = llm.bind_tools(tools)  # type: ignore[arg-type]
+
+    if len(_bound_runnables) >= _MAX_BOUND_RUNNABLES:
+        _bound_runnables.clear()
+    _bound_runnables[key] = (llm, runnable)
+    return runnable
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Honors the Retry-After header of rate limit responses, otherwise uses
+    exponential backoff with full jitter so concurrent callers don't retry
+    in lockstep.
+    """
+    response = getattr(error, "response", None)
+    if isinstance(error, RateLimitError) and response is not None:
+        retry_after = response.headers.get("retry-after")
+        try:
+            return min(MAX_BACKOFF_SECONDS, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, 0.5 * (2**attempt)))
 
 
 # Initialize the OpenAI client
@@ -85,41 +241,115 @@ def call_llm(
 ) -> AIMessage:  # type: ignore
     final_system_prompt = system_prompt if system_prompt else DEFAULT_SYSTEM_PROMPT
 
-    prompt_template = ChatPromptTemplate.from_messages(
-        [("system", final_system_prompt), ("user", "{prompt}")]
-    )
+    # Calls are made with temperature=0, so identical payloads can be served
+    # from the response cache when it is enabled.
+    cache_key = None
+    if is_llm_cache_enabled():
+        cache_key = make_cache_key(
+            model, model_type, final_system_prompt, prompt, output_schema, tools
+        )
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            return cached
 
     # Initialize the LLM.
-    llm = get_chat_model(
-        model=model,
-        model_type=model_type,
-        temperature=0,
-        streaming=False,
+    llm, prompt_template = _build_llm(
+        final_system_prompt, model=model, model_type=model_type, streaming=False
     )
 
     # Add structured output or tools to the LLM.
-    runnable = llm
-    if output_schema:
-        runnable = llm.with_structured_output(output_schema, method="function_calling")
-        if output_schema.__name__ == "OptimizedToolArgs":
-            # For tool argument optimization, we don't need the full message
-            runnable = llm.with_structured_output(output_schema, method="json_mode")
-    elif tools:
-        runnable = llm.bind_tools(tools)
+    runnable = _get_bound_runnable(llm, output_schema, tools)
 
     chain = prompt_template | runnable
 
-    # Retry logic for transient connection errors
-    for attempt in range(3):
+    # Retry logic for transient provider errors
+    for attempt in range(MAX_ATTEMPTS):
         try:
-            return chain.invoke({"prompt": prompt})  # type: ignore
+            response = chain.invoke({"prompt": prompt})
+            if cache_key is not None:
+                cache_response(cache_key, response)
+            return response  # type: ignore
         except KeyboardInterrupt:
             # Don't retry on user interrupt, propagate immediately
             raise
-        except APIConnectionError as e:
-            if attempt == 2:  # Last attempt
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1:  # Last attempt
                 raise
-            time.sleep(0.5 * (2**attempt))  # 0.5s, 1s backoff
+            time.sleep(_retry_delay(attempt, e))
+
+
+@lru_cache(maxsize=16)
+def _get_batch_schema(output_schema: Type[BaseModel]) -> Type[BaseModel]:
+    """Return a schema wrapping a list of output_schema results (one per prompt)."""
+    return create_model(
+        f"Batched{output_schema.__name__}",
+        results=(
+            List[output_schema],  # type: ignore[valid-type]
+            Field(
+                ...,
+                description="One result per question, in the same order as the questions.",
+            ),
+        ),
+    )
+
+
+def call_llm_batched(
+    prompts: List[str],
+    output_schema: Type[BaseModel],
+    system_prompt: Optional[str] = None,
+    model_type: Literal["standard", "strong"] = "standard",
+    model: MODEL_PROVIDER = "openai",
+) -> List[BaseModel]:
+    """
+    Answer several independent prompts with a single LLM round-trip.
+
+    The prompts are numbered into one request and the model returns one
+    ``output_schema`` result per prompt, in order. This amortizes network,
+    queueing and system prompt prefill overhead across small sub-calls.
+
+    Raises:
+        ValueError: If the model does not return exactly one result per prompt.
+    """
+    if len(prompts) == 1:
+        return [
+            call_llm(  # type: ignore[list-item]
+                prompts[0],
+                system_prompt=system_prompt,
+                output_schema=output_schema,
+                model_type=model_type,
+                model=model,
+            )
+        ]
+
+    batch_schema = _get_batch_schema(output_schema)
+
+    questions = "\n\n".join(
+        f"Question {i}:\n{prompt}" for i, prompt in enumerate(prompts, start=1)
+    )
+    batch_prompt = f"""
+    Answer each of the following {len(prompts)} questions independently.
+    Return exactly one result per question, in the same order as the questions.
+
+    {questions}
+    """
+
+    response = call_llm(
+        batch_prompt,
+        system_prompt=system_prompt,
+        output_schema=batch_schema,
+        model_type=model_type,
+        model=model,
+    )
+    results = (
+        response.get("results", [])  # type: ignore[union-attr]
+        if isinstance(response, dict)
+        else response.results  # type: ignore[attr-defined]
+    )
+    if len(results) != len(prompts):
+        raise ValueError(
+            f"Expected {len(prompts)} batched results, got {len(results)}"
+        )
+    return results
 
 
 def call_llm_stream(
@@ -136,34 +366,26 @@ def call_llm_stream(
     """
     final_system_prompt = system_prompt if system_prompt else DEFAULT_SYSTEM_PROMPT
 
-    prompt_template = ChatPromptTemplate.from_messages(
-        [("system", final_system_prompt), ("user", "{prompt}")]
-    )
-
     # Initialize the LLM with streaming enabled
-    llm = get_chat_model(
-        model=model,
-        model_type=model_type,
-        temperature=0,
-        streaming=True,
+    llm, prompt_template = _build_llm(
+        final_system_prompt, model=model, model_type=model_type, streaming=True
     )
 
     chain = prompt_template | llm
 
-    # Retry logic for transient connection errors
-    for attempt in range(3):
+    # Retry logic for transient provider errors
+    for attempt in range(MAX_ATTEMPTS):
         try:
             for chunk in chain.stream({"prompt": prompt}):
                 # LangChain streams AIMessage chunks, extract content
-                if hasattr(chunk, "content"):
-                    content = chunk.content
-                    if content:  # Only yield non-empty content
-                        yield content  # type: ignore
+                content = getattr(chunk, "content", None)
+                if content:  # Only yield non-empty content
+                    yield content  # type: ignore
             break
         except KeyboardInterrupt:
             # Don't retry on user interrupt, propagate immediately
             raise
-        except APIConnectionError as e:
-            if attempt == 2:  # Last attempt
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1:  # Last attempt
                 raise
-            time.sleep(0.5 * (2**attempt))  # 0.5s, 1s backoff
+            time.sleep(_retry_delay(attempt, e))
@@ -1,59 +1,47 @@
 # This file makes the directory a Python package
 import os
 
+from functools import lru_cache
+
 from langchain_core.tools import BaseTool
 
-from dexter.tools.finance.filings import get_filings
-from dexter.tools.finance.filings import get_10K_filing_items
-from dexter.tools.finance.filings import get_10Q_filing_items
-from dexter.tools.finance.filings import get_8K_filing_items
-from dexter.tools.finance.fundamentals import get_income_statements
-from dexter.tools.finance.fundamentals import get_balance_sheets
-from dexter.tools.finance.fundamentals import get_cash_flow_statements
-from dexter.tools.finance.fundamentals import get_all_financial_statements
-from dexter.tools.finance.metrics import get_financial_metrics_snapshot
-from dexter.tools.finance.metrics import get_financial_metrics
-from dexter.tools.finance.prices import get_price_snapshot
-from dexter.tools.finance.prices import get_prices
-from dexter.tools.finance.news import get_news
-from dexter.tools.finance.estimates import get_analyst_estimates
-from dexter.tools.finance.segments import get_segmented_revenues
-from dexter.tools.search.google import search_google_news
-from dexter.tools.search.tavily import tavily_get_social_media_sentiment
-from dexter.tools.search.tavily import tavily_get_macroeconomic_news
-from dexter.tools.search.tavily import tavily_get_company_news
-
-from dexter.tools.yfinance.filings import yf_get_filings
-from dexter.tools.yfinance.filings import yf_get_10K_filing_items
-from dexter.tools.yfinance.filings import yf_get_10Q_filing_items
-from dexter.tools.yfinance.filings import yf_get_8K_filing_items
-from dexter.tools.yfinance.fundamentals import yf_get_income_statements
-from dexter.tools.yfinance.fundamentals import yf_get_balance_sheets
-from dexter.tools.yfinance.fundamentals import yf_get_cash_flow_statements
-from dexter.tools.yfinance.fundamentals import yf_get_comprehensive_financials
-from dexter.tools.yfinance.metrics import yf_get_financial_metrics_snapshot
-from dexter.tools.yfinance.metrics import yf_get_financial_metrics
-from dexter.tools.yfinance.prices import yf_get_price_snapshot
-from dexter.tools.yfinance.prices import yf_get_prices
-from dexter.tools.yfinance.prices import yf_get_price_performance
-from dexter.tools.yfinance.news import yf_get_news
-from dexter.tools.yfinance.estimates import yf_get_analyst_estimates
-from dexter.tools.yfinance.agent.stanley_druckenmiller import (
-    stanley_druckenmiller_agent,
-)
-
-AVAILABLE_DATA_PROVIDERS = ["financialdatasets", "yfinance"]
-
-tavily_tools = []
-if os.environ.get("TAVILY_API_KEY"):
-    tavily_tools = [
+AVAILABLE_DATA_PROVIDERS = ("financialdatasets", "yfinance")
+
+
+def _get_tavily_tools() -> list[BaseTool]:
+    if not os.environ.get("TAVILY_API_KEY"):
+        return []
+
+    from dexter.tools.search.tavily import tavily_get_social_media_sentiment
+    from dexter.tools.search.tavily import tavily_get_macroeconomic_news
+    from dexter.tools.search.tavily import tavily_get_company_news
+
+    return [
         tavily_get_social_media_sentiment,
         tavily_get_macroeconomic_news,
         tavily_get_company_news,
     ]
 
-TOOLS: dict[str, list[BaseTool]] = {
-    "financialdatasets": [
+
+def _get_financialdatasets_tools() -> list[BaseTool]:
+    from dexter.tools.finance.filings import get_filings
+    from dexter.tools.finance.filings import get_10K_filing_items
+    from dexter.tools.finance.filings import get_10Q_filing_items
+    from dexter.tools.finance.filings import get_8K_filing_items
+    from dexter.tools.finance.fundamentals import get_income_statements
+    from dexter.tools.finance.fundamentals import get_balance_sheets
+    from dexter.tools.finance.fundamentals import get_cash_flow_statements
+    from dexter.tools.finance.fundamentals import get_all_financial_statements
+    from dexter.tools.finance.metrics import get_financial_metrics_snapshot
+    from dexter.tools.finance.metrics import get_financial_metrics
+    from dexter.tools.finance.prices import get_price_snapshot
+    from dexter.tools.finance.prices import get_prices
+    from dexter.tools.finance.news import get_news
+    from dexter.tools.finance.estimates import get_analyst_estimates
+    from dexter.tools.finance.segments import get_segmented_revenues
+    from dexter.tools.search.google import search_google_news
+
+    return [
         get_income_statements,
         get_balance_sheets,
         get_cash_flow_statements,
@@ -71,8 +59,29 @@ TOOLS: dict[str, list[BaseTool]] = {
         get_segmented_revenues,
         search_google_news,
     ]
-    + tavily_tools,
-    "yfinance": [
+
+
+def _get_yfinance_tools() -> list[BaseTool]:
+    from dexter.tools.yfinance.filings import yf_get_filings
+    from dexter.tools.yfinance.filings import yf_get_10K_filing_items
+    from dexter.tools.yfinance.filings import yf_get_10Q_filing_items
+    from dexter.tools.yfinance.filings import yf_get_8K_filing_items
+    from dexter.tools.yfinance.fundamentals import yf_get_income_statements
+    from dexter.tools.yfinance.fundamentals import yf_get_balance_sheets
+    from dexter.tools.yfinance.fundamentals import yf_get_cash_flow_statements
+    from dexter.tools.yfinance.fundamentals import yf_get_comprehensive_financials
+    from dexter.tools.yfinance.metrics import yf_get_financial_metrics_snapshot
+    from dexter.tools.yfinance.metrics import yf_get_financial_metrics
+    from dexter.tools.yfinance.prices import yf_get_price_snapshot
+    from dexter.tools.yfinance.prices import yf_get_prices
+    from dexter.tools.yfinance.prices import yf_get_price_performance
+    from dexter.tools.yfinance.news import yf_get_news
+    from dexter.tools.yfinance.estimates import yf_get_analyst_estimates
+    from dexter.tools.yfinance.agent.stanley_druckenmiller import (
+        stanley_druckenmiller_agent,
+    )
+
+    return [
         yf_get_comprehensive_financials,
         yf_get_income_statements,
         yf_get_balance_sheets,
@@ -90,5 +99,22 @@ TOOLS: dict[str, list[BaseTool]] = {
         yf_get_analyst_estimates,
         stanley_druckenmiller_agent,
     ]
-    + tavily_tools,
-}
+
+
+@lru_cache(maxsize=None)
+def get_tools(provider: str) -> list[BaseTool]:
+    """
+    Return the tools for a data provider, importing its modules on first use.
+
+    Only the selected provider's tool modules (and their heavy dependencies
+    such as yfinance/pandas) are imported. Callers must not mutate the
+    returned list since it is shared.
+    """
+    if provider == "financialdatasets":
+        return _get_financialdatasets_tools() + _get_tavily_tools()
+    if provider == "yfinance":
+        return _get_yfinance_tools() + _get_tavily_tools()
+    raise ValueError(
+        f"Unknown data provider: {provider}. "
+        f"Expected one of {', '.join(AVAILABLE_DATA_PROVIDERS)}"
+    )
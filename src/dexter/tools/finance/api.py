@@ -1,19 +1,68 @@
+import atexit
+import orjson
 import os
+import threading
 import requests
 
+from requests.adapters import HTTPAdapter
+from typing import Optional
+
 ####################################
 # API Configuration
 ####################################
 
 financial_datasets_api_key = os.getenv("FINANCIAL_DATASETS_API_KEY")
+# Batch endpoints are not available on every API plan, so they are opt-in
+batch_endpoints_enabled = os.getenv("DEXTER_FD_BATCH", "0").lower() in ("1", "true")
+
+BASE_URL = "https://api.financialdatasets.ai"
+REQUEST_TIMEOUT_SECONDS = 30
+# Sized for the concurrent per-ticker fan-out in the price tools
+MAX_POOL_CONNECTIONS = 32
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps connections alive across calls, so requests
+    after the first skip the TCP and TLS handshake. Responses are gzip
+    encoded (requests sends Accept-Encoding: gzip by default).
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=MAX_POOL_CONNECTIONS,
+                pool_maxsize=MAX_POOL_CONNECTIONS,
+            )
+            session.mount("https://", adapter)
+            atexit.register(session.close)
+            _session = session
+    return _session
 
 
 def call_api(endpoint: str, params: dict) -> dict:
     """Helper function to call the Financial Datasets API."""
-    base_url = "https://api.financialdatasets.ai"
-    url = f"{base_url}{endpoint}"
+    url = f"{BASE_URL}{endpoint}"
     headers = {"x-api-key": financial_datasets_api_key}
-    response = requests.get(url, params=params, headers=headers)
+    response = _get_session().get(
+        url, params=params, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS
+    )
     response.raise_for_status()
-    return response.json()
+    # orjson decodes large price/financials payloads several times faster
+    return orjson.loads(response.content)
+
 
+def call_api_batch(endpoint: str, payload: dict) -> dict:
+    """Helper function to POST a batched request to the Financial Datasets API."""
+    url = f"{BASE_URL}{endpoint}"
+    headers = {"x-api-key": financial_datasets_api_key}
+    response = _get_session().post(
+        url, json=payload, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
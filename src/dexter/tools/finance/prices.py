@@ -1,8 +1,11 @@
 # fmt: off
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from langchain.tools import tool
 from typing import Literal
 from pydantic import BaseModel, Field
-from dexter.tools.finance.api import call_api
+from dexter.tools.finance import api
+from dexter.tools.finance.api import call_api, call_api_batch
 
 class PriceSnapshotInput(BaseModel):
     """Input for get_price_snapshot."""
@@ -14,13 +17,33 @@ def get_price_snapshot(tickers: list[str]) -> dict:
     Fetches the most recent price snapshot for one more more stocks,
     including the latest price, trading volume, and other open, high, low, and close price data.
     """
-    snapshots = {}
-    for ticker in tickers:
-        params = {"ticker": ticker}
-        data = call_api("/prices/snapshot/", params)
-        snapshots[ticker] = data.get("snapshot", {})
-    
-    return snapshots
+    if not tickers:
+        return {}
+
+    if api.batch_endpoints_enabled and len(tickers) > 1:
+        try:
+            data = call_api_batch("/prices/snapshot/batch", {"tickers": tickers})
+        except (requests.RequestException, ValueError):
+            # Batch endpoint unavailable for this plan or returned a non-JSON body
+            data = None
+        snapshots = data.get("snapshots") if isinstance(data, dict) else None
+        if isinstance(snapshots, dict):
+            return {ticker: snapshots.get(ticker, {}) for ticker in tickers}
+        # Otherwise use per-ticker requests
+
+    # Snapshots are independent requests, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        results = list(executor.map(_fetch_price_snapshot, tickers))
+
+    return dict(zip(tickers, results))
+
+def _fetch_price_snapshot(ticker: str) -> dict:
+    try:
+        data = call_api("/prices/snapshot/", {"ticker": ticker})
+    except requests.RequestException as e:
+        # Don't let a single failing ticker fail the whole batch
+        return {"error": str(e)}
+    return data.get("snapshot", {})
 
 class PricesInput(BaseModel):
     """Input for get_prices."""
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from langchain.tools import tool
 from langchain_tavily import TavilySearch
@@ -22,16 +25,61 @@ def _get_tavily_tool() -> TavilySearch:
     return TavilySearch(max_results=3, include_answer=True)
 
 
-# Initialize the Tavily search tool once for reuse
-_tavily_tool = None
+# Initialize the Tavily search tool once at import for reuse across all tools.
+# dexter.tools only imports this module when TAVILY_API_KEY is set.
+_TAVILY_TOOL: Optional[TavilySearch] = (
+    _get_tavily_tool() if os.getenv("TAVILY_API_KEY") else None
+)
 
 
 def _ensure_tavily_initialized() -> TavilySearch:
-    """Lazy initialization of Tavily tool."""
-    global _tavily_tool
-    if _tavily_tool is None:
-        _tavily_tool = _get_tavily_tool()
-    return _tavily_tool
+    """Return the shared Tavily tool, initializing it if the key was set late."""
+    global _TAVILY_TOOL
+    if _TAVILY_TOOL is None:
+        _TAVILY_TOOL = _get_tavily_tool()
+    return _TAVILY_TOOL
+
+
+# Memoize search results per query so repeated calls within a session
+# (e.g. the agent retrying with identical args) skip the network round-trip.
+# The TTL is kept short because "recent" queries are time sensitive.
+_SEARCH_CACHE_TTL_SECONDS = 900
+_SEARCH_CACHE_MAX_SIZE = 256
+_search_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _cached_search(query: str) -> Any:
+    """Run a Tavily search, serving repeats of the same query from memory."""
+    now = time.monotonic()
+    with _search_cache_lock:
+        cached = _search_cache.get(query)
+        if cached is not None and now - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+            _search_cache.move_to_end(query)
+            return cached[1]
+
+    result = _ensure_tavily_initialized().invoke({"query": query})
+
+    # TavilySearch reports network and HTTP failures as {"error": ...}
+    # instead of raising, and those must not be replayed
+    if isinstance(result, dict) and "error" in result:
+        return result
+
+    with _search_cache_lock:
+        _search_cache[query] = (now, result)
+        _search_cache.move_to_end(query)
+        while len(_search_cache) > _SEARCH_CACHE_MAX_SIZE:
+            _search_cache.popitem(last=False)
+    return result
+
+
+def _time_context(trade_date: str) -> str:
+    """Describe trade_date as "recent" (within 2 weeks) or "around <date>"."""
+    try:
+        days_ago = (datetime.now() - datetime.fromisoformat(trade_date)).days
+    except (ValueError, TypeError):
+        return "recent"
+    return "recent" if days_ago <= 14 else f"around {trade_date}"
 
 
 class SocialMediaSentimentInput(BaseModel):
@@ -73,20 +121,12 @@ def tavily_get_social_media_sentiment(ticker: str, trade_date: str) -> dict:
 
     Returns up to 3 relevant search results with titles, URLs, and content snippets.
     """
-    tool = _ensure_tavily_initialized()
-
-    # Determine if trade_date is recent (within 2 weeks)
-    try:
-        trade_dt = datetime.fromisoformat(trade_date)
-        days_ago = (datetime.now() - trade_dt).days
-        time_context = "recent" if days_ago <= 14 else f"around {trade_date}"
-    except (ValueError, TypeError):
-        time_context = "recent"
+    time_context = _time_context(trade_date)
 
     query = (
         f"{ticker} stock sentiment investor opinion reddit stocktwits {time_context}"
     )
-    result = tool.invoke({"query": query})
+    result = _cached_search(query)
 
     return {
         "data_source": "tavily",
@@ -107,18 +147,10 @@ def tavily_get_macroeconomic_news(trade_date: str) -> dict:
 
     Returns up to 3 relevant search results with titles, URLs, and content snippets.
     """
-    tool = _ensure_tavily_initialized()
-
-    # Determine if trade_date is recent (within 2 weeks)
-    try:
-        trade_dt = datetime.fromisoformat(trade_date)
-        days_ago = (datetime.now() - trade_dt).days
-        time_context = "recent" if days_ago <= 14 else f"around {trade_date}"
-    except (ValueError, TypeError):
-        time_context = "recent"
+    time_context = _time_context(trade_date)
 
     query = f"stock market news economic trends Fed interest rates {time_context}"
-    result = tool.invoke({"query": query})
+    result = _cached_search(query)
 
     return {
         "data_source": "tavily",
@@ -138,8 +170,6 @@ def tavily_get_company_news(ticker: str, query_context: Optional[str] = None) ->
 
     Returns up to 3 relevant search results with titles, URLs, and content snippets.
     """
-    tool = _ensure_tavily_initialized()
-
     if query_context:
         # More action-oriented query when context is provided
         query = f"{ticker} {query_context} latest news updates"
@@ -147,7 +177,7 @@ def tavily_get_company_news(ticker: str, query_context: Optional[str] = None) ->
         # Broader query for general company news and catalysts
         query = f"{ticker} stock news earnings guidance analyst upgrades recent"
 
-    result = tool.invoke({"query": query})
+    result = _cached_search(query)
 
     return {
         "data_source": "tavily",
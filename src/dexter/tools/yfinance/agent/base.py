@@ -1,12 +1,66 @@
+import asyncio
+import functools
+
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import numpy as np
 
 from dexter.tools.yfinance.fundamentals import yf_search_line_items
 from dexter.tools.yfinance.news import yf_get_news
-from dexter.tools.yfinance.prices import yf_get_prices, yf_get_price_snapshot
+from dexter.tools.yfinance.prices import yf_get_prices_batch, yf_get_price_snapshot
 from dexter.tools.yfinance.insider import yf_get_insider_trades
 
+# Maximum number of tickers whose data is fetched at the same time
+CONCURRENCY_LIMIT = 8
+
+# Analyzer results memoized for the duration of one run_financial_analysis call
+_analysis_cache: ContextVar[Optional[dict]] = ContextVar("analysis_cache", default=None)
+
+
+def memoize_per_run(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Reuse a pure analyzer's result when several agents analyze the same data.
+
+    Inside run_financial_analysis every agent receives the same list objects
+    for a ticker, so inputs are keyed by identity. Each entry keeps its
+    arguments alive, so an id cannot be recycled while the cache exists.
+    Outside a run (or for keyword calls) the analyzer is called directly.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _analysis_cache.get()
+        if cache is None or kwargs:
+            return func(*args, **kwargs)
+
+        key = (func.__qualname__,) + tuple(
+            id(arg) if isinstance(arg, (list, dict)) else arg for arg in args
+        )
+        entry = cache.get(key)
+        if entry is None:
+            entry = cache[key] = (args, func(*args))
+        return entry[1]
+
+    return wrapper
+
+
+@memoize_per_run
+def closes_array(prices: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Return the non-null close prices as a float array, in input order.
+
+    Within a run the array is built once per ticker and shared by every
+    analyzer and agent that reads closes.
+    """
+    return np.fromiter(
+        (p["close"] for p in prices if p.get("close") is not None),
+        dtype=np.float64,
+    )
+
 
 class BaseFinancialAgent(ABC):
     """
@@ -41,79 +95,175 @@ class BaseFinancialAgent(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=32)
+def _aggregate_line_items(agents: tuple[BaseFinancialAgent, ...]) -> tuple[str, ...]:
+    """
+    Return the union of the agents' required line items, sorted.
+
+    Cached by agent identity so repeated runs with the same agents skip
+    re-evaluating required_line_items. The sorted order keeps the
+    fundamentals request (and its cache key) stable across runs.
+    """
+    line_items = set()
+    for agent in agents:
+        line_items.update(agent.required_line_items)
+    return tuple(sorted(line_items))
+
+
 def run_financial_analysis(
-    tickers: List[str], agents: List[BaseFinancialAgent]
+    tickers: List[str],
+    agents: List[BaseFinancialAgent],
+    incomplete_tickers: Optional[Set[str]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Orchestrates data fetching and analysis for multiple agents.
     Optimizes data fetching by aggregating requirements.
+
+    Synchronous wrapper around ``arun_financial_analysis``.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(arun_financial_analysis(tickers, agents, incomplete_tickers))
+
+    # asyncio.run() cannot be nested inside a running event loop (e.g. when
+    # the tool is invoked from async code), so run on a fresh loop in a thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(
+            asyncio.run, arun_financial_analysis(tickers, agents, incomplete_tickers)
+        ).result()
+
+
+def _has_core_data(bundle: Dict[str, Any]) -> bool:
+    # Insider trades and news may legitimately be empty; financials, prices
+    # and market cap are only missing when a fetch failed
+    return bool(
+        bundle["financials"] and bundle["prices"] and bundle["market_cap"] is not None
+    )
+
+
+async def arun_financial_analysis(
+    tickers: List[str],
+    agents: List[BaseFinancialAgent],
+    incomplete_tickers: Optional[Set[str]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch data and run agents for all tickers concurrently.
+
+    The per-ticker fetches are independent network calls, so they run in
+    worker threads and are gathered together; at most CONCURRENCY_LIMIT
+    tickers are fetched at once to stay polite to Yahoo Finance. Tickers
+    are analyzed in completion order while later fetches are in flight.
+
+    Tickers whose financials, prices or market cap came back empty are
+    added to ``incomplete_tickers`` when it is given, so callers can avoid
+    caching results computed from failed fetches.
     """
     # Aggregate required line items
-    all_line_items = set()
-    for agent in agents:
-        all_line_items.update(agent.required_line_items)
+    all_line_items = _aggregate_line_items(tuple(agents))
 
     # Ensure we have basic items if not requested
     # (Though yf_search_line_items handles this, explicit is better)
 
-    results = {}
-
-    for ticker in tickers:
-        ticker_results = {}
+    semaphore = asyncio.Semaphore(CONCURRENCY_LIMIT)
 
-        # 1. Fetch Financials
-        financial_line_items = yf_search_line_items(
-            ticker=ticker,
-            line_items=list(all_line_items),
-            period="annual",
-            limit=4,
+    # 3. Fetch Market Cap: yf_get_price_snapshot accepts a list, so every
+    # ticker's snapshot is fetched in one call that overlaps the other fetches
+    async def fetch_market_caps() -> Dict[str, Optional[float]]:
+        # Call the tools' underlying functions directly: .invoke would add
+        # LangChain's argument validation and callback bookkeeping per call
+        snapshot_data = await asyncio.to_thread(
+            yf_get_price_snapshot.func, tickers=tickers
         )
+        # Flatten once so each ticker needs a single lookup
+        return {
+            ticker: ((entry or {}).get("snapshot") or {}).get("market_cap")
+            for ticker, entry in snapshot_data.items()
+        }
 
-        # 2. Fetch Prices
-        end_date = datetime.now().date().isoformat()
-        start_date = (datetime.now() - timedelta(days=365)).date().isoformat()
-        prices_data = yf_get_prices.invoke(
-            {
-                "ticker": ticker,
-                "interval": "day",
-                "interval_multiplier": 1,
-                "start_date": start_date,
-                "end_date": end_date,
-            }
-        )
-        prices = prices_data.get("prices", [])
+    market_caps_task = asyncio.create_task(fetch_market_caps())
 
-        # 3. Fetch Market Cap
-        snapshot_data = yf_get_price_snapshot.invoke({"tickers": [ticker]})
-        market_cap = snapshot_data.get(ticker, {}).get("snapshot", {}).get("market_cap")
+    # Compute the date window once so every ticker (and every cache key)
+    # in this run uses the same dates
+    today = datetime.now().date()
+    end_date = today.isoformat()
+    start_date = (today - timedelta(days=365)).isoformat()
 
-        # 4. Fetch Insider Trades
-        insider_trades = yf_get_insider_trades(
-            ticker=ticker, end_date=end_date, start_date=start_date, limit=50
+    # 2. Fetch Prices: every ticker shares the same window, so one
+    # yf.download request covers them all
+    prices_task = asyncio.create_task(
+        asyncio.to_thread(
+            yf_get_prices_batch,
+            tickers=tickers,
+            interval="day",
+            interval_multiplier=1,
+            start_date=start_date,
+            end_date=end_date,
         )
+    )
 
-        # 5. Fetch News
-        company_news = yf_get_news.invoke(
-            {
-                "ticker": ticker,
-                "start_date": start_date,
-                "end_date": end_date,
-                "limit": 50,
-            }
-        )
-        news_items = company_news.get("news", [])
+    async def fetch(ticker: str) -> tuple[str, Dict[str, Any]]:
+        async with semaphore:
+            (
+                financial_line_items,
+                insider_trades,
+                company_news,
+            ) = await asyncio.gather(
+                # 1. Fetch Financials
+                asyncio.to_thread(
+                    yf_search_line_items,
+                    ticker=ticker,
+                    line_items=list(all_line_items),
+                    period="annual",
+                    limit=4,
+                ),
+                # 4. Fetch Insider Trades
+                asyncio.to_thread(
+                    yf_get_insider_trades,
+                    ticker=ticker,
+                    end_date=end_date,
+                    start_date=start_date,
+                    limit=50,
+                ),
+                # 5. Fetch News
+                asyncio.to_thread(
+                    yf_get_news.func,
+                    ticker=ticker,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=50,
+                ),
+            )
 
+        prices_by_ticker = await prices_task
+        market_caps = await market_caps_task
+        return ticker, {
+            "ticker": ticker,
+            "financials": financial_line_items,
+            "prices": prices_by_ticker.get(ticker, []),
+            "market_cap": market_caps.get(ticker),
+            "insider_trades": insider_trades,
+            "news": company_news.get("news", []),
+        }
+
+    def analyze(bundle: Dict[str, Any]) -> Dict[str, Any]:
         # 6. Run Agents
-        for agent in agents:
-            ticker_results[agent.name] = agent.analyze(
-                ticker=ticker,
-                financials=financial_line_items,
-                prices=prices,
-                market_cap=market_cap,
-                insider_trades=insider_trades,
-                news=news_items,
-            )
+        return {agent.name: agent.analyze(**bundle) for agent in agents}
 
-        results[ticker] = ticker_results
+    results: Dict[str, Dict[str, Any]] = {}
+    token = _analysis_cache.set({})
+    try:
+        # Every ticker's fetches are scheduled up front; each ticker is
+        # analyzed as soon as its data arrives, off the event loop, so the
+        # agents' CPU work overlaps with the remaining network I/O
+        fetch_tasks = [asyncio.create_task(fetch(ticker)) for ticker in tickers]
+        for next_bundle in asyncio.as_completed(fetch_tasks):
+            ticker, bundle = await next_bundle
+            if incomplete_tickers is not None and not _has_core_data(bundle):
+                incomplete_tickers.add(ticker)
+            results[ticker] = await asyncio.to_thread(analyze, bundle)
+    finally:
+        _analysis_cache.reset(token)
 
-    return results
+    # Preserve the input ticker order
+    return {ticker: results[ticker] for ticker in tickers}
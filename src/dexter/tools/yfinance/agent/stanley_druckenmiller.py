@@ -1,9 +1,90 @@
-import statistics
+import bisect
+import copy
+import threading
+import time
+
+from collections import OrderedDict
+from datetime import date
 from typing import Any, Dict, List, Optional
 
 from langchain.tools import tool
 
-from dexter.tools.yfinance.agent.base import BaseFinancialAgent, run_financial_analysis
+from dexter.tools.yfinance.agent.base import (
+    BaseFinancialAgent,
+    closes_array,
+    memoize_per_run,
+    run_financial_analysis,
+)
+
+# Line items used by the analyzers; extracted together in a single pass
+LINE_ITEM_KEYS = (
+    "revenue",
+    "earnings_per_share",
+    "total_debt",
+    "shareholders_equity",
+    "net_income",
+    "free_cash_flow",
+    "ebit",
+    "ebitda",
+    "cash_and_equivalents",
+)
+
+# Scoring buckets: each threshold crossed is worth one point.
+# Labels are indexed by the points awarded.
+GROWTH_THRESHOLDS = (0.01, 0.04, 0.08)  # annualized CAGR, scored when exceeded
+REVENUE_GROWTH_LABELS = (
+    "Minimal/negative revenue growth",
+    "Slight annualized revenue growth",
+    "Moderate annualized revenue growth",
+    "Strong annualized revenue growth",
+)
+EPS_GROWTH_LABELS = (
+    "Minimal/negative annualized EPS growth",
+    "Slight annualized EPS growth",
+    "Moderate annualized EPS growth",
+    "Strong annualized EPS growth",
+)
+MOMENTUM_THRESHOLDS = (0.0, 0.20, 0.50)  # price change, scored when exceeded
+MOMENTUM_LABELS = (
+    "Negative price momentum",
+    "Slight positive momentum",
+    "Moderate price momentum",
+    "Very strong price momentum",
+)
+DEBT_TO_EQUITY_THRESHOLDS = (0.3, 0.7, 1.5)  # scored when below
+DEBT_TO_EQUITY_LABELS = (
+    "High debt-to-equity",
+    "Somewhat high debt-to-equity",
+    "Moderate debt-to-equity",
+    "Low debt-to-equity",
+)
+VOLATILITY_THRESHOLDS = (0.01, 0.02, 0.04)  # daily returns stdev, scored when below
+VOLATILITY_LABELS = (
+    "Very high volatility",
+    "High volatility",
+    "Moderate volatility",
+    "Low volatility",
+)
+
+# Valuation multiples score up to 2 points each, scored when below
+PE_THRESHOLDS = (15, 25)
+PE_LABELS = ("High or Very high P/E", "Fair P/E", "Attractive P/E")
+PFCF_THRESHOLDS = (15, 25)
+PFCF_LABELS = ("High/Very high P/FCF", "Fair P/FCF", "Attractive P/FCF")
+EV_EBIT_THRESHOLDS = (15, 25)
+EV_EBIT_LABELS = ("High EV/EBIT", "Fair EV/EBIT", "Attractive EV/EBIT")
+EV_EBITDA_THRESHOLDS = (10, 18)
+EV_EBITDA_LABELS = ("High EV/EBITDA", "Fair EV/EBITDA", "Attractive EV/EBITDA")
+
+
+def _points_above(value: float, thresholds: tuple[float, ...]) -> int:
+    """Count the thresholds that value strictly exceeds."""
+    return bisect.bisect_left(thresholds, value)
+
+
+def _points_below(value: float, thresholds: tuple[float, ...]) -> int:
+    """Count the thresholds that value stays strictly below."""
+    return len(thresholds) - bisect.bisect_right(thresholds, value)
 
 
 class StanleyDruckenmillerAgent(BaseFinancialAgent):
@@ -13,25 +94,28 @@ class StanleyDruckenmillerAgent(BaseFinancialAgent):
       - Emphasizing growth, momentum, and sentiment
       - Willing to be aggressive if conditions are favorable
       - Focus on preserving capital by avoiding high-risk, low-reward bets
+
+    Set include_details=False to return scores only, without the
+    per-analysis detail strings.
     """
 
+    def __init__(self, include_details: bool = True):
+        self.include_details = include_details
+
+    def _finalize(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        # Analyzer results may be shared between agents, so build a new dict
+        result = {"score": analysis.get("score", 0)}
+        if self.include_details:
+            result["details"] = analysis.get("details", "")
+        return result
+
     @property
     def name(self) -> str:
         return "stanley_druckenmiller"
 
     @property
     def required_line_items(self) -> List[str]:
-        return [
-            "revenue",
-            "earnings_per_share",
-            "total_debt",
-            "shareholders_equity",
-            "net_income",
-            "free_cash_flow",
-            "ebit",
-            "ebitda",
-            "cash_and_equivalents",
-        ]
+        return list(LINE_ITEM_KEYS)
 
     def analyze(
         self,
@@ -73,16 +157,35 @@ class StanleyDruckenmillerAgent(BaseFinancialAgent):
 
         return {
             "signal": signal,
-            "score": float(f"{total_score:.1f}"),
+            "score": round(total_score, 1),
             "max_score": max_possible_score,
-            "growth_momentum_analysis": growth_momentum_analysis,
-            "sentiment_analysis": sentiment_analysis,
-            "insider_activity": insider_activity,
-            "risk_reward_analysis": risk_reward_analysis,
-            "valuation_analysis": valuation_analysis,
+            "growth_momentum_analysis": self._finalize(growth_momentum_analysis),
+            "sentiment_analysis": self._finalize(sentiment_analysis),
+            "insider_activity": self._finalize(insider_activity),
+            "risk_reward_analysis": self._finalize(risk_reward_analysis),
+            "valuation_analysis": self._finalize(valuation_analysis),
         }
 
 
+# Shared instance so repeated tool calls reuse the cached line-item aggregation
+_DEFAULT_AGENT = StanleyDruckenmillerAgent()
+
+# Per-ticker results are reused within a session: the analysis only depends
+# on the ticker and the day it is run for
+_RESULT_CACHE_TTL_SECONDS = 3600
+_RESULT_CACHE_MAX_SIZE = 1024
+_result_cache: OrderedDict[tuple[str, str], tuple[float, Dict[str, Any]]] = (
+    OrderedDict()
+)
+_result_cache_lock = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Drop all memoized per-ticker analysis results."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
 @tool
 def stanley_druckenmiller_agent(tickers: list[str]) -> dict:
     """
@@ -102,19 +205,77 @@ def stanley_druckenmiller_agent(tickers: list[str]) -> dict:
 
     This agent synthesizes these three pillars into a single score and signal.
     """
-    agent = StanleyDruckenmillerAgent()
-    results = run_financial_analysis(tickers, [agent])
+    agent = _DEFAULT_AGENT
+    end_date = date.today().isoformat()
+    now = time.monotonic()
+
+    # Cached results are copied in and out so callers can't mutate them
+    final_results: Dict[str, Dict[str, Any]] = {}
+    with _result_cache_lock:
+        for ticker in tickers:
+            cached = _result_cache.get((ticker.upper(), end_date))
+            if cached is not None and now - cached[0] < _RESULT_CACHE_TTL_SECONDS:
+                final_results[ticker] = copy.deepcopy(cached[1])
+
+    missing = [ticker for ticker in tickers if ticker not in final_results]
+    if missing:
+        incomplete: set[str] = set()
+        results = run_financial_analysis(missing, [agent], incomplete)
+
+        # Extract the results for this specific agent
+        # run_financial_analysis returns {ticker: {agent_name: result}}
+        # We want to return {ticker: result} to match previous behavior
+        with _result_cache_lock:
+            for ticker, agent_results in results.items():
+                final_results[ticker] = agent_results[agent.name]
+                # Results from failed fetches would pin a "Sell" for an hour
+                if ticker in incomplete:
+                    continue
+                key = (ticker.upper(), end_date)
+                _result_cache[key] = (now, copy.deepcopy(final_results[ticker]))
+                _result_cache.move_to_end(key)
+            while len(_result_cache) > _RESULT_CACHE_MAX_SIZE:
+                _result_cache.popitem(last=False)
+
+    return {ticker: final_results[ticker] for ticker in tickers}
+
+
+def _num(value: Any) -> int | float | None:
+    """
+    Return value if it is a plain int or float, else None.
+
+    Line items are already converted to Python scalars by
+    yf_search_line_items, so an exact type check is enough here.
+    """
+    return value if type(value) in (int, float) else None
 
-    # Extract the results for this specific agent
-    # run_financial_analysis returns {ticker: {agent_name: result}}
-    # We want to return {ticker: result} to match previous behavior
-    final_results = {}
-    for ticker, agent_results in results.items():
-        final_results[ticker] = agent_results[agent.name]
 
-    return final_results
+def _latest(values: list, default: Any = None) -> Any:
+    """Return the most recent value of a line-item column, or default."""
+    return values[0] if values else default
 
 
+@memoize_per_run
+def _line_item_columns(
+    financial_line_items: list, keys: tuple[str, ...] = LINE_ITEM_KEYS
+) -> dict:
+    """
+    Collect the non-null values of each key in one pass over the line items.
+
+    Returns a dict mapping each key to its values, most recent period first.
+    Within a run the columns are built once per ticker and shared by every
+    analyzer, so callers must not mutate them.
+    """
+    columns = {key: [] for key in keys}
+    for fi in financial_line_items:
+        for key, values in columns.items():
+            value = fi.get(key)
+            if value is not None:
+                values.append(value)
+    return columns
+
+
+@memoize_per_run
 def analyze_growth_and_momentum(financial_line_items: list, prices: list) -> dict:
     """
     Evaluate:
@@ -131,41 +292,25 @@ def analyze_growth_and_momentum(financial_line_items: list, prices: list) -> dic
     details = []
     raw_score = 0  # We'll sum up a maximum of 9 raw points, then scale to 0–10
 
+    columns = _line_item_columns(financial_line_items)
+
     #
     # 1. Revenue Growth (annualized CAGR)
     #
-    revenues = [
-        fi.get("revenue")
-        for fi in financial_line_items
-        if fi.get("revenue") is not None
-    ]
+    revenues = columns["revenue"]
     if len(revenues) >= 2:
-        latest_rev = revenues[0]
-        older_rev = revenues[-1]
+        latest_rev = _num(revenues[0])
+        older_rev = _num(revenues[-1])
         num_years = len(revenues) - 1
 
         # Ensure values are numbers
-        if isinstance(latest_rev, (int, float)) and isinstance(older_rev, (int, float)):
+        if latest_rev is not None and older_rev is not None:
             if older_rev > 0 and latest_rev > 0:
                 # CAGR formula: (ending_value/beginning_value)^(1/years) - 1
                 rev_growth = (latest_rev / older_rev) ** (1 / num_years) - 1
-                if rev_growth > 0.08:  # 8% annualized (adjusted for CAGR)
-                    raw_score += 3
-                    details.append(
-                        f"Strong annualized revenue growth: {rev_growth:.1%}"
-                    )
-                elif rev_growth > 0.04:  # 4% annualized
-                    raw_score += 2
-                    details.append(
-                        f"Moderate annualized revenue growth: {rev_growth:.1%}"
-                    )
-                elif rev_growth > 0.01:  # 1% annualized
-                    raw_score += 1
-                    details.append(
-                        f"Slight annualized revenue growth: {rev_growth:.1%}"
-                    )
-                else:
-                    details.append(f"Minimal/negative revenue growth: {rev_growth:.1%}")
+                points = _points_above(rev_growth, GROWTH_THRESHOLDS)
+                raw_score += points
+                details.append(f"{REVENUE_GROWTH_LABELS[points]}: {rev_growth:.1%}")
             else:
                 details.append(
                     "Older revenue is zero/negative; can't compute revenue growth."
@@ -178,34 +323,20 @@ def analyze_growth_and_momentum(financial_line_items: list, prices: list) -> dic
     #
     # 2. EPS Growth (annualized CAGR)
     #
-    eps_values = [
-        fi.get("earnings_per_share")
-        for fi in financial_line_items
-        if fi.get("earnings_per_share") is not None
-    ]
+    eps_values = columns["earnings_per_share"]
     if len(eps_values) >= 2:
-        latest_eps = eps_values[0]
-        older_eps = eps_values[-1]
+        latest_eps = _num(eps_values[0])
+        older_eps = _num(eps_values[-1])
         num_years = len(eps_values) - 1
 
-        if isinstance(latest_eps, (int, float)) and isinstance(older_eps, (int, float)):
+        if latest_eps is not None and older_eps is not None:
             # Calculate CAGR for positive EPS values
             if older_eps > 0 and latest_eps > 0:
                 # CAGR formula for EPS
                 eps_growth = (latest_eps / older_eps) ** (1 / num_years) - 1
-                if eps_growth > 0.08:  # 8% annualized (adjusted for CAGR)
-                    raw_score += 3
-                    details.append(f"Strong annualized EPS growth: {eps_growth:.1%}")
-                elif eps_growth > 0.04:  # 4% annualized
-                    raw_score += 2
-                    details.append(f"Moderate annualized EPS growth: {eps_growth:.1%}")
-                elif eps_growth > 0.01:  # 1% annualized
-                    raw_score += 1
-                    details.append(f"Slight annualized EPS growth: {eps_growth:.1%}")
-                else:
-                    details.append(
-                        f"Minimal/negative annualized EPS growth: {eps_growth:.1%}"
-                    )
+                points = _points_above(eps_growth, GROWTH_THRESHOLDS)
+                raw_score += points
+                details.append(f"{EPS_GROWTH_LABELS[points]}: {eps_growth:.1%}")
             else:
                 details.append(
                     "Older EPS is near zero; skipping EPS growth calculation."
@@ -221,23 +352,15 @@ def analyze_growth_and_momentum(financial_line_items: list, prices: list) -> dic
     # We'll give up to 3 points for strong momentum
     if prices and len(prices) > 30:
         # Prices are already sorted by date in yf_get_prices
-        close_prices = [p.get("close") for p in prices if p.get("close") is not None]
+        close_prices = closes_array(prices)
         if len(close_prices) >= 2:
-            start_price = close_prices[0]
-            end_price = close_prices[-1]
+            start_price = float(close_prices[0])
+            end_price = float(close_prices[-1])
             if start_price > 0:
                 pct_change = (end_price - start_price) / start_price
-                if pct_change > 0.50:
-                    raw_score += 3
-                    details.append(f"Very strong price momentum: {pct_change:.1%}")
-                elif pct_change > 0.20:
-                    raw_score += 2
-                    details.append(f"Moderate price momentum: {pct_change:.1%}")
-                elif pct_change > 0:
-                    raw_score += 1
-                    details.append(f"Slight positive momentum: {pct_change:.1%}")
-                else:
-                    details.append(f"Negative price momentum: {pct_change:.1%}")
+                points = _points_above(pct_change, MOMENTUM_THRESHOLDS)
+                raw_score += points
+                details.append(f"{MOMENTUM_LABELS[points]}: {pct_change:.1%}")
             else:
                 details.append("Invalid start price (<= 0); can't compute momentum.")
         else:
@@ -249,11 +372,12 @@ def analyze_growth_and_momentum(financial_line_items: list, prices: list) -> dic
     #   revenue growth, eps growth, momentum
     # => max raw_score = 9
     # Scale to 0–10
-    final_score = min(10, (raw_score / 9) * 10)
+    final_score = min(10.0, (raw_score / 9) * 10)
 
-    return {"score": float(f"{final_score:.2f}"), "details": "; ".join(details)}
+    return {"score": round(final_score, 2), "details": "; ".join(details)}
 
 
+@memoize_per_run
 def analyze_risk_reward(financial_line_items: list, prices: list) -> dict:
     """
     Assesses risk via:
@@ -270,16 +394,9 @@ def analyze_risk_reward(financial_line_items: list, prices: list) -> dict:
     #
     # 1. Debt-to-Equity
     #
-    debt_values = [
-        fi.get("total_debt")
-        for fi in financial_line_items
-        if fi.get("total_debt") is not None
-    ]
-    equity_values = [
-        fi.get("shareholders_equity")
-        for fi in financial_line_items
-        if fi.get("shareholders_equity") is not None
-    ]
+    columns = _line_item_columns(financial_line_items)
+    debt_values = columns["total_debt"]
+    equity_values = columns["shareholders_equity"]
 
     if (
         debt_values
@@ -290,17 +407,9 @@ def analyze_risk_reward(financial_line_items: list, prices: list) -> dict:
         recent_debt = debt_values[0]
         recent_equity = equity_values[0] if equity_values[0] else 1e-9
         de_ratio = recent_debt / recent_equity
-        if de_ratio < 0.3:
-            raw_score += 3
-            details.append(f"Low debt-to-equity: {de_ratio:.2f}")
-        elif de_ratio < 0.7:
-            raw_score += 2
-            details.append(f"Moderate debt-to-equity: {de_ratio:.2f}")
-        elif de_ratio < 1.5:
-            raw_score += 1
-            details.append(f"Somewhat high debt-to-equity: {de_ratio:.2f}")
-        else:
-            details.append(f"High debt-to-equity: {de_ratio:.2f}")
+        points = _points_below(de_ratio, DEBT_TO_EQUITY_THRESHOLDS)
+        raw_score += points
+        details.append(f"{DEBT_TO_EQUITY_LABELS[points]}: {de_ratio:.2f}")
     else:
         details.append("No consistent debt/equity data available.")
 
@@ -314,31 +423,21 @@ def analyze_risk_reward(financial_line_items: list, prices: list) -> dict:
         # We need to parse 'time' if we want to sort, or assume they are sorted.
         # yf_get_prices returns sorted by date ascending usually.
         # But let's just extract closes.
-        close_prices = [p.get("close") for p in prices if p.get("close") is not None]
+        close_prices = closes_array(prices)
 
         if len(close_prices) > 10:
-            daily_returns = []
-            for i in range(1, len(close_prices)):
-                prev_close = close_prices[i - 1]
-                if prev_close > 0:
-                    daily_returns.append((close_prices[i] - prev_close) / prev_close)
-            if daily_returns:
-                stdev = statistics.pstdev(daily_returns)  # population stdev
-                if stdev < 0.01:
-                    raw_score += 3
-                    details.append(f"Low volatility: daily returns stdev {stdev:.2%}")
-                elif stdev < 0.02:
-                    raw_score += 2
-                    details.append(
-                        f"Moderate volatility: daily returns stdev {stdev:.2%}"
-                    )
-                elif stdev < 0.04:
-                    raw_score += 1
-                    details.append(f"High volatility: daily returns stdev {stdev:.2%}")
-                else:
-                    details.append(
-                        f"Very high volatility: daily returns stdev {stdev:.2%}"
-                    )
+            # Skip returns whose previous close is non-positive
+            prev_closes = close_prices[:-1]
+            valid = prev_closes > 0
+            prev_closes = prev_closes[valid]
+            daily_returns = (close_prices[1:][valid] - prev_closes) / prev_closes
+            if daily_returns.size:
+                stdev = float(daily_returns.std())  # population stdev
+                points = _points_below(stdev, VOLATILITY_THRESHOLDS)
+                raw_score += points
+                details.append(
+                    f"{VOLATILITY_LABELS[points]}: daily returns stdev {stdev:.2%}"
+                )
             else:
                 details.append("Insufficient daily returns data for volatility calc.")
         else:
@@ -349,10 +448,11 @@ def analyze_risk_reward(financial_line_items: list, prices: list) -> dict:
         details.append("Not enough price data for volatility analysis.")
 
     # raw_score out of 6 => scale to 0–10
-    final_score = min(10, (raw_score / 6) * 10)
-    return {"score": float(f"{final_score:.2f}"), "details": "; ".join(details)}
+    final_score = min(10.0, (raw_score / 6) * 10)
+    return {"score": round(final_score, 2), "details": "; ".join(details)}
 
 
+@memoize_per_run
 def analyze_valuation(financial_line_items: list, market_cap: float | None) -> dict:
     """
     Druckenmiller is willing to pay up for growth, but still checks:
@@ -368,115 +468,65 @@ def analyze_valuation(financial_line_items: list, market_cap: float | None) -> d
     details = []
     raw_score = 0
 
-    # Gather needed data
-    net_incomes = [
-        fi.get("net_income")
-        for fi in financial_line_items
-        if fi.get("net_income") is not None
-    ]
-    fcf_values = [
-        fi.get("free_cash_flow")
-        for fi in financial_line_items
-        if fi.get("free_cash_flow") is not None
-    ]
-    ebit_values = [
-        fi.get("ebit") for fi in financial_line_items if fi.get("ebit") is not None
-    ]
-    ebitda_values = [
-        fi.get("ebitda") for fi in financial_line_items if fi.get("ebitda") is not None
-    ]
+    # Only the most recent value of each line item is used
+    columns = _line_item_columns(financial_line_items)
+    recent_net_income = _latest(columns["net_income"])
+    recent_fcf = _latest(columns["free_cash_flow"])
+    recent_ebit = _latest(columns["ebit"])
+    recent_ebitda = _latest(columns["ebitda"])
 
     # For EV calculation, let's get the most recent total_debt & cash
-    debt_values = [
-        fi.get("total_debt")
-        for fi in financial_line_items
-        if fi.get("total_debt") is not None
-    ]
-    cash_values = [
-        fi.get("cash_and_equivalents")
-        for fi in financial_line_items
-        if fi.get("cash_and_equivalents") is not None
-    ]
-    recent_debt = debt_values[0] if debt_values else 0
-    recent_cash = cash_values[0] if cash_values else 0
+    recent_debt = _latest(columns["total_debt"], 0)
+    recent_cash = _latest(columns["cash_and_equivalents"], 0)
 
     enterprise_value = market_cap + recent_debt - recent_cash
+    # Both EV multiples need a positive enterprise value
+    positive_ev = enterprise_value > 0
 
     # 1) P/E
-    recent_net_income = net_incomes[0] if net_incomes else None
     if recent_net_income and recent_net_income > 0:
         pe = market_cap / recent_net_income
-        pe_points = 0
-        if pe < 15:
-            pe_points = 2
-            details.append(f"Attractive P/E: {pe:.2f}")
-        elif pe < 25:
-            pe_points = 1
-            details.append(f"Fair P/E: {pe:.2f}")
-        else:
-            details.append(f"High or Very high P/E: {pe:.2f}")
-        raw_score += pe_points
+        points = _points_below(pe, PE_THRESHOLDS)
+        raw_score += points
+        details.append(f"{PE_LABELS[points]}: {pe:.2f}")
     else:
         details.append("No positive net income for P/E calculation")
 
     # 2) P/FCF
-    recent_fcf = fcf_values[0] if fcf_values else None
     if recent_fcf and recent_fcf > 0:
         pfcf = market_cap / recent_fcf
-        pfcf_points = 0
-        if pfcf < 15:
-            pfcf_points = 2
-            details.append(f"Attractive P/FCF: {pfcf:.2f}")
-        elif pfcf < 25:
-            pfcf_points = 1
-            details.append(f"Fair P/FCF: {pfcf:.2f}")
-        else:
-            details.append(f"High/Very high P/FCF: {pfcf:.2f}")
-        raw_score += pfcf_points
+        points = _points_below(pfcf, PFCF_THRESHOLDS)
+        raw_score += points
+        details.append(f"{PFCF_LABELS[points]}: {pfcf:.2f}")
     else:
         details.append("No positive free cash flow for P/FCF calculation")
 
     # 3) EV/EBIT
-    recent_ebit = ebit_values[0] if ebit_values else None
-    if enterprise_value > 0 and recent_ebit and recent_ebit > 0:
+    if positive_ev and recent_ebit and recent_ebit > 0:
         ev_ebit = enterprise_value / recent_ebit
-        ev_ebit_points = 0
-        if ev_ebit < 15:
-            ev_ebit_points = 2
-            details.append(f"Attractive EV/EBIT: {ev_ebit:.2f}")
-        elif ev_ebit < 25:
-            ev_ebit_points = 1
-            details.append(f"Fair EV/EBIT: {ev_ebit:.2f}")
-        else:
-            details.append(f"High EV/EBIT: {ev_ebit:.2f}")
-        raw_score += ev_ebit_points
+        points = _points_below(ev_ebit, EV_EBIT_THRESHOLDS)
+        raw_score += points
+        details.append(f"{EV_EBIT_LABELS[points]}: {ev_ebit:.2f}")
     else:
         details.append("No valid EV/EBIT because EV <= 0 or EBIT <= 0")
 
     # 4) EV/EBITDA
-    recent_ebitda = ebitda_values[0] if ebitda_values else None
-    if enterprise_value > 0 and recent_ebitda and recent_ebitda > 0:
+    if positive_ev and recent_ebitda and recent_ebitda > 0:
         ev_ebitda = enterprise_value / recent_ebitda
-        ev_ebitda_points = 0
-        if ev_ebitda < 10:
-            ev_ebitda_points = 2
-            details.append(f"Attractive EV/EBITDA: {ev_ebitda:.2f}")
-        elif ev_ebitda < 18:
-            ev_ebitda_points = 1
-            details.append(f"Fair EV/EBITDA: {ev_ebitda:.2f}")
-        else:
-            details.append(f"High EV/EBITDA: {ev_ebitda:.2f}")
-        raw_score += ev_ebitda_points
+        points = _points_below(ev_ebitda, EV_EBITDA_THRESHOLDS)
+        raw_score += points
+        details.append(f"{EV_EBITDA_LABELS[points]}: {ev_ebitda:.2f}")
     else:
         details.append("No valid EV/EBITDA because EV <= 0 or EBITDA <= 0")
 
     # We have up to 2 points for each of the 4 metrics => 8 raw points max
     # Scale raw_score to 0–10
-    final_score = min(10, (raw_score / 8) * 10)
+    final_score = min(10.0, (raw_score / 8) * 10)
 
-    return {"score": float(f"{final_score:.2f}"), "details": "; ".join(details)}
+    return {"score": round(final_score, 2), "details": "; ".join(details)}
 
 
+@memoize_per_run
 def analyze_insider_activity(insider_trades: list) -> dict:
     """
     Simple insider-trade analysis:
@@ -526,6 +576,7 @@ def analyze_insider_activity(insider_trades: list) -> dict:
     return {"score": score, "details": "; ".join(details)}
 
 
+@memoize_per_run
 def analyze_sentiment(news_items: list) -> dict:
     """
     Basic news sentiment: negative keyword check vs. overall volume.
@@ -0,0 +1,124 @@
+"""On-disk TTL cache for data fetched through the yfinance API."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+CACHE_DIR = Path(".dexter/cache/yfinance")
+
+# Time-to-live per endpoint, in seconds
+FUNDAMENTALS_TTL = 30 * 24 * 60 * 60  # annual/quarterly statements change slowly
+PRICES_TTL = 24 * 60 * 60
+LIVE_PRICES_TTL = 5 * 60  # intraday bars and ranges that reach the current day
+SNAPSHOT_TTL = 5 * 60
+INSIDER_TTL = 24 * 60 * 60
+NEWS_TTL = 60 * 60
+
+_MISS = object()
+
+
+def is_cache_enabled() -> bool:
+    """Return False when caching is disabled via DEXTER_YF_CACHE=false."""
+    return os.getenv("DEXTER_YF_CACHE", "true").lower() not in ("0", "false")
+
+
+class FileCache:
+    """Stores JSON-serialisable results as files keyed by endpoint and params."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def make_key(params: dict) -> str:
+        """Hash the call parameters (sorted for consistent keys)."""
+        params_str = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.md5(params_str.encode()).hexdigest()
+
+    def _path(self, endpoint: str, key: str) -> Path:
+        return self.cache_dir / endpoint / f"{key}.json"
+
+    def get(self, endpoint: str, key: str, ttl: float) -> Any:
+        """Return the cached value, or ``_MISS`` if absent, expired or unreadable."""
+        path = self._path(endpoint, key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return _MISS
+        if time.time() - entry.get("timestamp", 0) > ttl:
+            return _MISS
+        return entry.get("value")
+
+    def set(self, endpoint: str, key: str, value: Any) -> None:
+        """Store a value. Failures are ignored since the cache is best-effort."""
+        path = self._path(endpoint, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so concurrent readers never see
+            # a partially written entry
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"timestamp": time.time(), "value": value}, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+
+_file_cache = FileCache()
+
+
+def cached(
+    endpoint: str,
+    ttl: float | Callable[[dict], float],
+    cache: Optional[FileCache] = None,
+    should_cache: Callable[[Any], bool] = bool,
+) -> Callable[[F], F]:
+    """Cache a fetcher's JSON-serialisable result on disk for ``ttl`` seconds.
+
+    The cache key is derived from the bound call arguments (defaults applied),
+    so positional and keyword calls share entries. A ``ticker`` argument is
+    stripped and upper-cased first so that "aapl" and " AAPL" share an entry.
+    ``ttl`` may also be a callable that receives those arguments, for data
+    whose freshness depends on the request. Results for which ``should_cache`` is false are not
+    cached to avoid pinning transient fetch failures. The default only skips
+    falsy results, so fetchers returning wrapper dicts need their own check.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_cache_enabled():
+                return func(*args, **kwargs)
+
+            file_cache = cache or _file_cache
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if isinstance(bound.arguments.get("ticker"), str):
+                bound.arguments["ticker"] = bound.arguments["ticker"].strip().upper()
+            arguments = dict(bound.arguments)
+            key = file_cache.make_key(arguments)
+            entry_ttl = ttl(arguments) if callable(ttl) else ttl
+
+            value = file_cache.get(endpoint, key, entry_ttl)
+            if value is not _MISS:
+                return value
+
+            value = func(*bound.args, **bound.kwargs)
+            if should_cache(value):
+                file_cache.set(endpoint, key, value)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
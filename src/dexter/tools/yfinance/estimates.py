@@ -42,6 +42,7 @@ def yf_get_analyst_estimates(
     tool but is not used because Yahoo Finance does not segment estimates by
     reporting period.
     """
+    ticker = ticker.strip().upper()
     ticker_obj = get_ticker(ticker)
 
     price_targets = _serialise(getattr(ticker_obj, "analyst_price_targets", None))
@@ -53,7 +54,7 @@ def yf_get_analyst_estimates(
 
     return {
         "data_source": "yfinance",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "price_targets": price_targets,
         "analysis": analysis,
         "recommendations_summary": recommendations_summary,
@@ -148,6 +148,7 @@ def yf_get_filings(
     discovery when the agent is configured for the yfinance provider. Only valid for US listed
     companies.
     """
+    ticker = ticker.strip().upper()
     filings = _get_sec_filings(ticker)
     results: list[dict] = []
 
@@ -181,6 +182,7 @@ def yf_get_10K_filing_items(
     returns the requested sections so the agent can quote narrative content
     without FinancialDatasets access.
     """
+    ticker = ticker.strip().upper()
     filings = _get_sec_filings(ticker)
     filing = _select_filing(
         filings,
@@ -189,7 +191,7 @@ def yf_get_10K_filing_items(
     )
     if not filing:
         return {
-            "error": f"No 10-K filing found for {ticker.upper()} in {year} via yfinance.",
+            "error": f"No 10-K filing found for {ticker} in {year} via yfinance.",
             "items": [],
         }
 
@@ -199,7 +201,7 @@ def yf_get_10K_filing_items(
 
     return {
         "resource": "filing_items",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "filing_type": "10-K",
         "year": year,
         "items": items,
@@ -219,6 +221,7 @@ def yf_get_10Q_filing_items(
     Helpful for quarterly MD&A or risk discussions when operating in
     `yfinance` mode. Only valid for US listed companies.
     """
+    ticker = ticker.strip().upper()
     quarter = max(1, min(4, quarter))
 
     def _is_target_quarter(filing: dict) -> bool:
@@ -232,7 +235,7 @@ def yf_get_10Q_filing_items(
     filing = _select_filing(filings, "10-Q", _is_target_quarter)
     if not filing:
         return {
-            "error": f"No 10-Q filing for {ticker.upper()} in {year} Q{quarter} via yfinance.",
+            "error": f"No 10-Q filing for {ticker} in {year} Q{quarter} via yfinance.",
             "items": [],
         }
 
@@ -242,7 +245,7 @@ def yf_get_10Q_filing_items(
 
     return {
         "resource": "filing_items",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "filing_type": "10-Q",
         "year": year,
         "quarter": quarter,
@@ -262,11 +265,12 @@ def yf_get_8K_filing_items(
     Matches the specified filing in Yahoo Finance's feed, fetches the SEC HTML,
     and returns the requested sections for disclosure summarisation. Only valid for US listed companies.
     """
+    ticker = ticker.strip().upper()
     filings = _get_sec_filings(ticker)
     filing = _match_accession(filings, accession_number)
     if not filing or filing.get("type") != "8-K":
         return {
-            "error": f"No 8-K filing with accession {accession_number} found for {ticker.upper()} via yfinance.",
+            "error": f"No 8-K filing with accession {accession_number} found for {ticker} via yfinance.",
             "items": [],
         }
 
@@ -276,7 +280,7 @@ def yf_get_8K_filing_items(
 
     return {
         "resource": "filing_items",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "filing_type": "8-K",
         "accession_number": accession_number,
         "items": items,
@@ -2,22 +2,124 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pandas as pd
 
 from langchain.tools import tool
 from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from dexter.tools.finance.fundamentals import FinancialStatementsInput
+from dexter.tools.yfinance.cache import FUNDAMENTALS_TTL, cached
 from dexter.tools.yfinance.shared import (
-    apply_period_filters,
+    filter_period_columns,
     frame_to_records,
     get_ticker,
-    limit_records,
     load_statement_frame,
     to_python,
 )
 
+# Statement frames are cached in memory so that successive tool calls for the
+# same ticker (e.g. comprehensive financials, then a single statement) reuse
+# one fetch. Frames are shared, so callers must not mutate them.
+_STATEMENT_CACHE_TTL_SECONDS = 600
+_STATEMENT_CACHE_MAX_SIZE = 512
+_statement_cache: OrderedDict[tuple[str, str, str], tuple[float, Any]] = OrderedDict()
+_statement_cache_lock = threading.Lock()
+
+# The agent usually asks for all three statements of a ticker back-to-back, so
+# a miss fetches the whole set for that period. Concurrent misses for the same
+# (ticker, period) wait on the in-flight fetch instead of issuing their own.
+_STATEMENT_TYPES = ("income_stmt", "balance_sheet", "cashflow")
+_pending_statements: dict[tuple[str, str], Future] = {}
+
+
+def _load_cached_statement(
+    ticker: str,
+    base_name: str,
+    period: Literal["annual", "quarterly", "ttm"],
+) -> pd.DataFrame | None:
+    """Load a statement frame, serving repeats within the TTL from memory."""
+    key = (ticker.upper(), base_name, period)
+    with _statement_cache_lock:
+        cached = _statement_cache.get(key)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < _STATEMENT_CACHE_TTL_SECONDS
+        ):
+            _statement_cache.move_to_end(key)
+            return cached[1]
+
+    return _fetch_statement_set(ticker, period)[base_name]
+
+
+def _fetch_statement_set(
+    ticker: str, period: Literal["annual", "quarterly", "ttm"]
+) -> dict[str, pd.DataFrame | None]:
+    """Fetch (or join the in-flight fetch of) all statements for one period."""
+    key = (ticker.upper(), period)
+    with _statement_cache_lock:
+        future = _pending_statements.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _pending_statements[key] = Future()
+    if not is_owner:
+        return future.result()
+
+    try:
+        # Each worker builds its own Ticker rather than sharing one across threads
+        with ThreadPoolExecutor(max_workers=len(_STATEMENT_TYPES)) as executor:
+            loaded = executor.map(
+                lambda base_name: load_statement_frame(
+                    get_ticker(ticker), base_name, period
+                ),
+                _STATEMENT_TYPES,
+            )
+            frames = dict(zip(_STATEMENT_TYPES, loaded))
+        _store_statements(ticker, period, frames)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(frames)
+        return frames
+    finally:
+        with _statement_cache_lock:
+            _pending_statements.pop(key, None)
+
+
+def _store_statements(
+    ticker: str,
+    period: Literal["annual", "quarterly", "ttm"],
+    frames: dict[str, pd.DataFrame | None],
+) -> None:
+    """Cache the fetched frames, skipping missing or empty ones.
+
+    yfinance returns empty frames when throttled, so those are refetched on
+    the next call instead of reporting no data for the rest of the TTL.
+    """
+    now = time.monotonic()
+    with _statement_cache_lock:
+        for base_name, frame in frames.items():
+            if frame is None or frame.empty:
+                continue
+            key = (ticker.upper(), base_name, period)
+            _statement_cache[key] = (now, frame)
+            _statement_cache.move_to_end(key)
+        while len(_statement_cache) > _STATEMENT_CACHE_MAX_SIZE:
+            _statement_cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """Drop all in-memory statement frames so the next call refetches them."""
+    with _statement_cache_lock:
+        _statement_cache.clear()
+
 
 def _prepare_response(
     ticker: str,
@@ -30,25 +132,34 @@ def _prepare_response(
     report_period_lte: Optional[str],
     statement_label: str,
 ) -> dict:
-    records = frame_to_records(frame)
-    records = apply_period_filters(
-        records,
+    # Filter and limit the period columns before building any records
+    frame = filter_period_columns(
+        frame,
         report_period_gt,
         report_period_gte,
         report_period_lt,
         report_period_lte,
     )
-    records = limit_records(records, limit)
+    records = frame_to_records(frame, limit=limit if limit and limit > 0 else None)
     return {
         "data_source": "yfinance",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "statement": statement_label,
         "period": period,
         "results": records,
     }
 
 
+def _has_statement_results(response: dict) -> bool:
+    return bool(response.get("results"))
+
+
 @tool(args_schema=FinancialStatementsInput)
+@cached(
+    endpoint="income_statements",
+    ttl=FUNDAMENTALS_TTL,
+    should_cache=_has_statement_results,
+)
 def yf_get_income_statements(
     ticker: str,
     period: Literal["annual", "quarterly", "ttm"],
@@ -66,8 +177,8 @@ def yf_get_income_statements(
     date filters plus a maximum number of periods (`limit`).
     Yahoo Finance may not have extensive historical annual/quarterly/ttm data for all tickers.
     """
-    ticker_obj = get_ticker(ticker)
-    frame = load_statement_frame(ticker_obj, "income_stmt", period)
+    ticker = ticker.strip().upper()
+    frame = _load_cached_statement(ticker, "income_stmt", period)
     return _prepare_response(
         ticker,
         period,
@@ -82,6 +193,11 @@ def yf_get_income_statements(
 
 
 @tool(args_schema=FinancialStatementsInput)
+@cached(
+    endpoint="balance_sheets",
+    ttl=FUNDAMENTALS_TTL,
+    should_cache=_has_statement_results,
+)
 def yf_get_balance_sheets(
     ticker: str,
     period: Literal["annual", "quarterly", "ttm"],
@@ -99,8 +215,8 @@ def yf_get_balance_sheets(
     tool.
     Yahoo Finance may not have extensive historical annual/quarterly/ttm data for all tickers.
     """
-    ticker_obj = get_ticker(ticker)
-    frame = load_statement_frame(ticker_obj, "balance_sheet", period)
+    ticker = ticker.strip().upper()
+    frame = _load_cached_statement(ticker, "balance_sheet", period)
     return _prepare_response(
         ticker,
         period,
@@ -115,6 +231,11 @@ def yf_get_balance_sheets(
 
 
 @tool(args_schema=FinancialStatementsInput)
+@cached(
+    endpoint="cash_flow_statements",
+    ttl=FUNDAMENTALS_TTL,
+    should_cache=_has_statement_results,
+)
 def yf_get_cash_flow_statements(
     ticker: str,
     period: Literal["annual", "quarterly", "ttm"],
@@ -131,8 +252,8 @@ def yf_get_cash_flow_statements(
     statement tools in supported arguments and response shape.
     Yahoo Finance may not have extensive historical annual/quarterly/ttm data for all tickers.
     """
-    ticker_obj = get_ticker(ticker)
-    frame = load_statement_frame(ticker_obj, "cashflow", period)
+    ticker = ticker.strip().upper()
+    frame = _load_cached_statement(ticker, "cashflow", period)
     return _prepare_response(
         ticker,
         period,
@@ -169,7 +290,20 @@ class ComprehensiveFinancialsInput(BaseModel):
     )
 
 
+def _has_comprehensive_results(response: dict) -> bool:
+    return any(
+        records
+        for statements in response.get("statements", {}).values()
+        for records in statements.values()
+    )
+
+
 @tool(args_schema=ComprehensiveFinancialsInput)
+@cached(
+    endpoint="comprehensive_financials",
+    ttl=FUNDAMENTALS_TTL,
+    should_cache=_has_comprehensive_results,
+)
 def yf_get_comprehensive_financials(
     ticker: str,
     include_quarterly: bool = True,
@@ -204,10 +338,10 @@ def yf_get_comprehensive_financials(
 
     Token savings: ~70-80% compared to multiple individual calls.
     """
-    ticker_obj = get_ticker(ticker)
+    ticker = ticker.strip().upper()
     result = {
         "data_source": "yfinance",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "statements": {},
     }
 
@@ -225,16 +359,46 @@ def yf_get_comprehensive_financials(
         ("cashflow", "cash_flow_statement"),
     ]
 
-    for period, limit in periods_to_fetch:
-        result["statements"][period] = {}
-        for attr_name, label in statement_types:
-            frame = load_statement_frame(ticker_obj, attr_name, period)
-            records = frame_to_records(frame, limit=limit if period != "ttm" else None)
-            result["statements"][period][label] = records
+    if not periods_to_fetch:
+        return result
+
+    def fetch(period: str, limit: int) -> dict[str, list[dict]]:
+        # The first statement load fetches the period's whole set at once
+        record_limit = limit if period != "ttm" else None
+        return {
+            label: frame_to_records(
+                _load_cached_statement(ticker, attr_name, period), limit=record_limit
+            )
+            for attr_name, label in statement_types
+        }
+
+    # Every period is a separate set of Yahoo requests, so fetch them
+    # concurrently
+    with ThreadPoolExecutor(max_workers=len(periods_to_fetch)) as executor:
+        statements = executor.map(lambda task: fetch(*task), periods_to_fetch)
+        for (period, _), period_statements in zip(periods_to_fetch, statements):
+            result["statements"][period] = period_statements
 
     return result
 
 
+# Labels read by yf_search_line_items' calculated items (margins, EBIT/EBITDA)
+_CALCULATION_LABELS = (
+    "Total Revenue",
+    "Operating Revenue",
+    "Gross Profit",
+    "Operating Income",
+    "Net Income",
+    "Net Income Common Stockholders",
+    "Interest Expense",
+    "Tax Provision",
+    "Reconciled Depreciation",
+    "Depreciation And Amortization",
+    "EBIT",
+)
+
+
+@cached(endpoint="line_items", ttl=FUNDAMENTALS_TTL)
 def yf_search_line_items(
     ticker: str,
     line_items: list[str],
@@ -263,36 +427,7 @@ def yf_search_line_items(
     if period != "annual":
         raise ValueError("Only 'annual' period is supported for yf_search_line_items")
 
-    ticker_obj = get_ticker(ticker)
-
-    # Load all statements
-    income = load_statement_frame(ticker_obj, "income_stmt", "annual")
-    balance = load_statement_frame(ticker_obj, "balance_sheet", "annual")
-    cashflow = load_statement_frame(ticker_obj, "cashflow", "annual")
-
-    frames = [f for f in [income, balance, cashflow] if f is not None and not f.empty]
-
-    if not frames:
-        return []
-
-    # Concatenate all frames.
-    # Note: yfinance frames have dates as columns.
-    # We align them by column (date).
-    combined = pd.concat(frames)
-
-    # Remove duplicate indices (line items) to avoid ambiguity
-    combined = combined.loc[~combined.index.duplicated(keep="first")]
-
-    # Transpose so dates are rows
-    combined = combined.T
-
-    # Sort by date descending (newest first)
-    combined = combined.sort_index(ascending=False)
-
-    # Limit
-    combined = combined.head(limit)
-
-    results = []
+    ticker = ticker.strip().upper()
 
     # Mapping from requested key to yfinance index label(s)
     # Priority list for lookup
@@ -318,90 +453,115 @@ def yf_search_line_items(
         "ev": [],
     }
 
-    for date_idx, row in combined.iterrows():
-        # date_idx is Timestamp
-        year = date_idx.year if hasattr(date_idx, "year") else str(date_idx)  # type: ignore
+    # Load all statements; the first miss fetches all three concurrently and
+    # the other two are then served from the statement cache
+    income = _load_cached_statement(ticker, "income_stmt", "annual")
+    balance = _load_cached_statement(ticker, "balance_sheet", "annual")
+    cashflow = _load_cached_statement(ticker, "cashflow", "annual")
 
-        record = {"period": year}
+    frames = [f for f in [income, balance, cashflow] if f is not None and not f.empty]
+
+    if not frames:
+        return []
+
+    # Keep only the line items that can contribute to the result (requested
+    # labels plus the inputs of the calculated items) so the concat and
+    # transpose below move a few rows instead of whole statements
+    needed_labels = set(_CALCULATION_LABELS)
+    for item in line_items:
+        needed_labels.update(mapping.get(item, [item]))
+    frames = [frame.loc[frame.index.isin(needed_labels)] for frame in frames]
 
-        # Helper to find value
-        def get_val(keys):
-            for k in keys:
-                if k in row.index:
-                    val = row[k]
-                    # Ensure scalar if duplicates somehow persist
-                    if isinstance(val, pd.Series):
-                        val = val.iloc[0]
-
-                    if pd.notna(val):
-                        return to_python(val)
+    # Concatenate all frames.
+    # Note: yfinance frames have dates as columns.
+    # We align them by column (date).
+    combined = pd.concat(frames)
+
+    # Remove duplicate indices (line items) to avoid ambiguity
+    combined = combined.loc[~combined.index.duplicated(keep="first")]
+
+    # Transpose so dates are rows
+    combined = combined.T
+
+    # Sort by date descending (newest first)
+    combined = combined.sort_index(ascending=False)
+
+    # Limit
+    combined = combined.head(limit)
+
+    def column(labels: list[str]) -> Optional[pd.Series]:
+        # First non-null value per period across the candidate labels
+        series = None
+        for label in labels:
+            if label in combined.columns:
+                values = combined[label]
+                series = values if series is None else series.combine_first(values)
+        return series
+
+    def numeric(labels: list[str]) -> Optional[pd.Series]:
+        series = column(labels)
+        return None if series is None else pd.to_numeric(series, errors="coerce")
+
+    def ratio(numerator, denominator) -> Optional[pd.Series]:
+        if numerator is None or denominator is None:
             return None
+        return numerator / denominator.where(denominator != 0)
+
+    def fill(series, fallback) -> Optional[pd.Series]:
+        if series is None or fallback is None:
+            return fallback if series is None else series
+        return series.combine_first(fallback)
+
+    # Pre-compute common columns for calculations, once for all periods
+    total_revenue = numeric(["Total Revenue", "Operating Revenue"])
+    net_income = numeric(["Net Income", "Net Income Common Stockholders"])
+    interest_expense = numeric(["Interest Expense"])
+    tax_provision = numeric(["Tax Provision"])
+    depreciation_amortization = numeric(
+        ["Reconciled Depreciation", "Depreciation And Amortization"]
+    )
 
-        # Pre-fetch common values for calculations
-        total_revenue = get_val(["Total Revenue", "Operating Revenue"])
-        gross_profit = get_val(["Gross Profit"])
-        operating_income = get_val(["Operating Income"])
-        net_income = get_val(["Net Income", "Net Income Common Stockholders"])
-        interest_expense = get_val(["Interest Expense"])
-        tax_provision = get_val(["Tax Provision"])
-        depreciation_amortization = get_val(
-            ["Reconciled Depreciation", "Depreciation And Amortization"]
-        )
-
-        for item in line_items:
-            if item in mapping:
-                val = get_val(mapping[item])
-
-                # Handle calculations
-                if item == "gross_margin":
-                    if (
-                        isinstance(gross_profit, (int, float))
-                        and isinstance(total_revenue, (int, float))
-                        and total_revenue != 0
-                    ):
-                        val = gross_profit / total_revenue
-                elif item == "operating_margin":
-                    if (
-                        isinstance(operating_income, (int, float))
-                        and isinstance(total_revenue, (int, float))
-                        and total_revenue != 0
-                    ):
-                        val = operating_income / total_revenue
-                elif item == "ebit":
-                    # Fallback calculation for EBIT: Net Income + Interest + Tax
-                    if val is None:
-                        if (
-                            isinstance(net_income, (int, float))
-                            and isinstance(interest_expense, (int, float))
-                            and isinstance(tax_provision, (int, float))
-                        ):
-                            val = net_income + interest_expense + tax_provision
-                elif item == "ebitda":
-                    # Fallback calculation for EBITDA: EBIT + Depreciation & Amortization
-                    if val is None:
-                        # Try to get EBIT first (either direct or calculated)
-                        ebit_val = get_val(["EBIT"])
-                        if ebit_val is None:
-                            if (
-                                isinstance(net_income, (int, float))
-                                and isinstance(interest_expense, (int, float))
-                                and isinstance(tax_provision, (int, float))
-                            ):
-                                ebit_val = net_income + interest_expense + tax_provision
-
-                        if isinstance(ebit_val, (int, float)) and isinstance(
-                            depreciation_amortization, (int, float)
-                        ):
-                            val = ebit_val + depreciation_amortization
-
-                if val is not None:
-                    record[item] = val
-            else:
-                # Try direct match if not in mapping
-                val = get_val([item])
-                if val is not None:
-                    record[item] = val
+    # Fallback calculation for EBIT: Net Income + Interest + Tax
+    ebit_fallback = None
+    if not any(s is None for s in (net_income, interest_expense, tax_provision)):
+        ebit_fallback = net_income + interest_expense + tax_provision
+
+    columns: dict[str, pd.Series] = {}
+    for item in line_items:
+        # Handle calculations
+        if item == "gross_margin":
+            series = ratio(numeric(["Gross Profit"]), total_revenue)
+        elif item == "operating_margin":
+            series = ratio(numeric(["Operating Income"]), total_revenue)
+        elif item == "ebit":
+            series = fill(column(["EBIT"]), ebit_fallback)
+        elif item == "ebitda":
+            # Fallback calculation for EBITDA: EBIT + Depreciation & Amortization
+            ebit = fill(numeric(["EBIT"]), ebit_fallback)
+            ebitda_fallback = None
+            if ebit is not None and depreciation_amortization is not None:
+                ebitda_fallback = ebit + depreciation_amortization
+            series = fill(column(["EBITDA"]), ebitda_fallback)
+        else:
+            # Try direct match if not in mapping
+            series = column(mapping.get(item, [item]))
+
+        if series is not None:
+            columns[item] = series
+
+    periods = [
+        date_idx.year if hasattr(date_idx, "year") else str(date_idx)  # type: ignore
+        for date_idx in combined.index
+    ]
+    values_by_item = {item: series.tolist() for item, series in columns.items()}
 
+    results = []
+    for position, year in enumerate(periods):
+        record = {"period": year}
+        for item, values in values_by_item.items():
+            value = to_python(values[position])
+            if value is not None:
+                record[item] = value
         results.append(record)
 
     return results
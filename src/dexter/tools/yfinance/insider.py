@@ -7,9 +7,11 @@ from typing import Optional
 
 import pandas as pd
 
+from dexter.tools.yfinance.cache import INSIDER_TTL, cached
 from dexter.tools.yfinance.shared import get_ticker, to_python
 
 
+@cached(endpoint="insider_trades", ttl=INSIDER_TTL)
 def yf_get_insider_trades(
     ticker: str,
     end_date: str,
@@ -28,6 +30,7 @@ def yf_get_insider_trades(
     Returns:
         List of dictionaries matching the InsiderTrade schema.
     """
+    ticker = ticker.strip().upper()
     ticker_obj = get_ticker(ticker)
 
     # yfinance returns a DataFrame for insider transactions
@@ -53,8 +56,6 @@ def yf_get_insider_trades(
         else:
             pass
 
-    records = []
-
     # Parse filter dates
     try:
         end_dt = datetime.fromisoformat(end_date)
@@ -63,31 +64,57 @@ def yf_get_insider_trades(
         end_dt = datetime.now()
         start_dt = None
 
-    for _, row in trades_df.iterrows():
-        # Extract date
-        trade_date = None
-        if date_col and pd.notna(row.get(date_col)):
-            val = row[date_col]
-            if isinstance(val, (pd.Timestamp, datetime)):
-                trade_date = val
-            else:
-                try:
-                    trade_date = pd.to_datetime(val)
-                except:
-                    pass
-
-        # Filter by date
-        if trade_date:
-            if trade_date > end_dt:
-                continue
-            if start_dt and trade_date < start_dt:
-                continue
+    # Parse the trade dates for the whole frame at once (unparsable -> NaT)
+    if date_col:
+        trade_dates = pd.to_datetime(trades_df[date_col], errors="coerce")
+    else:
+        trade_dates = pd.Series(pd.NaT, index=trades_df.index)
+
+    # Filter by date; NaT compares False, so trades without a date are kept
+    keep = ~(trade_dates > end_dt)
+    if start_dt:
+        keep &= ~(trade_dates < start_dt)
+
+    # Sort by date descending (undated trades last) and limit before any
+    # records are built
+    trades = trades_df.assign(_trade_date=trade_dates).loc[keep.to_numpy()]
+    if limit > 0:
+        # Only the newest `limit` trades are ordered rather than all of them.
+        # nlargest skips NaT, so undated trades are appended after
+        undated = trades["_trade_date"].isna().to_numpy()
+        newest = trades.loc[~undated].nlargest(limit, "_trade_date")
+        if len(newest) < limit:
+            newest = pd.concat(
+                [newest, trades.loc[undated].head(limit - len(newest))]
+            )
+        trades = newest
+    else:
+        trades = trades.sort_values(
+            "_trade_date", ascending=False, na_position="last", kind="stable"
+        ).head(limit)
+
+    def column(name: str, default=None) -> list:
+        if name in trades.columns:
+            return trades[name].tolist()
+        return [default] * len(trades)
+
+    records = []
+    for trade_date, shares, value, position, text, insider, ownership in zip(
+        trades["_trade_date"].tolist(),
+        column("Shares"),
+        column("Value"),
+        column("Position", ""),
+        column("Text", ""),
+        column("Insider"),
+        column("Ownership"),
+    ):
+        trade_date = trade_date if pd.notna(trade_date) else None
 
         # Extract values
-        shares = to_python(row.get("Shares"))
-        value = to_python(row.get("Value"))
-        position = str(row.get("Position", ""))
-        text = str(row.get("Text", ""))
+        shares = to_python(shares)
+        value = to_python(value)
+        position = str(position)
+        text = str(text)
 
         # Adjust shares sign based on transaction type
         # yfinance 'Shares' is absolute, but 'Text' indicates Sale/Purchase
@@ -114,9 +141,9 @@ def yf_get_insider_trades(
         is_director = "Director" in position if position else None
 
         record = {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "issuer": None,
-            "name": str(row.get("Insider")) if pd.notna(row.get("Insider")) else None,
+            "name": str(insider) if pd.notna(insider) else None,
             "title": position if position else None,
             "is_board_director": is_director,
             "transaction_date": trade_date.isoformat() if trade_date else None,
@@ -124,7 +151,7 @@ def yf_get_insider_trades(
             "transaction_price_per_share": price_per_share,
             "transaction_value": value,
             "shares_owned_before_transaction": None,
-            "shares_owned_after_transaction": to_python(row.get("Ownership")),
+            "shares_owned_after_transaction": to_python(ownership),
             "security_title": None,
             "filing_date": (
                 trade_date.isoformat() if trade_date else ""
@@ -133,7 +160,4 @@ def yf_get_insider_trades(
 
         records.append(record)
 
-    # Sort by date descending
-    records.sort(key=lambda x: x.get("transaction_date", "") or "", reverse=True)
-
-    return records[:limit]
+    return records
@@ -40,12 +40,13 @@ def yf_get_financial_metrics_snapshot(ticker: str) -> dict:
     answer quick "what's the multiple?" questions without calling the
     FinancialDatasets API.
     """
+    ticker = ticker.strip().upper()
     ticker_obj = get_ticker(ticker)
     fast_info = getattr(ticker_obj, "fast_info", None)
     info = getattr(ticker_obj, "info", {}) or {}
 
     snapshot = {
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "currency": (
             getattr(fast_info, "currency", None) if fast_info else info.get("currency")
         ),
@@ -188,6 +189,7 @@ def yf_get_financial_metrics(
     periods. Mirrors the FinancialDatasets version so the agent can swap
     providers seamlessly.
     """
+    ticker = ticker.strip().upper()
     ticker_obj = get_ticker(ticker)
     income_frame = load_statement_frame(ticker_obj, "income_stmt", period)
     balance_frame = load_statement_frame(ticker_obj, "balance_sheet", period)
@@ -201,7 +203,7 @@ def yf_get_financial_metrics(
     if not candidate_frames:
         return {
             "data_source": "yfinance",
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "period": period,
             "metrics": [],
         }
@@ -238,7 +240,7 @@ def yf_get_financial_metrics(
 
     return {
         "data_source": "yfinance",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "period": period,
         "metrics": records,
     }
@@ -8,6 +8,7 @@ from typing import Optional, Sequence
 from langchain.tools import tool
 
 from dexter.tools.finance.news import NewsInput
+from dexter.tools.yfinance.cache import NEWS_TTL, cached
 from dexter.tools.yfinance.shared import get_ticker
 
 
@@ -58,7 +59,12 @@ def _first_url(candidates: Sequence[object]) -> Optional[str]:
     return None
 
 
+def _has_news(response: dict) -> bool:
+    return bool(response["news"])
+
+
 @tool(args_schema=NewsInput)
+@cached(endpoint="news", ttl=NEWS_TTL, should_cache=_has_news)
 def yf_get_news(
     ticker: str,
     start_date: Optional[str] = None,
@@ -66,6 +72,7 @@ def yf_get_news(
     limit: int = 5,
 ) -> dict:
     """Return structured news articles for a ticker via Yahoo Finance / yfinance."""
+    ticker = ticker.strip().upper()
     ticker_obj = get_ticker(ticker)
     articles = getattr(ticker_obj, "news", None) or []
 
@@ -123,6 +130,6 @@ def yf_get_news(
 
     return {
         "data_source": "yfinance",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "news": results,
     }
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import functools
+import threading
+import time
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 from typing import Literal, Optional
 
 import pandas as pd
 import numpy as np
+import yfinance as yf
 from langchain.tools import tool
 
 from dexter.tools.finance.prices import PriceSnapshotInput, PricesInput
+from dexter.tools.yfinance.cache import (
+    LIVE_PRICES_TTL,
+    PRICES_TTL,
+    SNAPSHOT_TTL,
+    cached,
+)
 from dexter.tools.yfinance.shared import get_ticker, to_python
 
 _MINUTE_INTERVALS: dict[int, str] = {
@@ -22,40 +34,54 @@ _MINUTE_INTERVALS: dict[int, str] = {
     90: "90m",
 }
 
+# Bars per year for a multiplier of 1, used to annualize volatility
+_PERIODS_PER_YEAR: dict[str, float] = {
+    # Assume 6.5 trading hours per day, 252 trading days per year
+    "minute": 252 * 6.5 * 60,
+    "day": 252,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+
+
+# Intervals yfinance serves directly, keyed by (interval, multiplier)
+_NATIVE_INTERVALS: dict[tuple[str, int], str] = {
+    **{("minute", minutes): value for minutes, value in _MINUTE_INTERVALS.items()},
+    ("day", 1): "1d",
+    ("day", 5): "5d",
+    ("week", 1): "1wk",
+    ("month", 1): "1mo",
+    ("month", 3): "3mo",
+}
+
+# Other multipliers: the interval to download and the resample rule's unit
+_RESAMPLED_INTERVALS: dict[str, tuple[str, str]] = {
+    "day": ("1d", "D"),
+    "week": ("1d", "W"),
+    "month": ("1d", "M"),
+    "year": ("1mo", "Y"),
+}
+
 
+@functools.lru_cache(maxsize=64)
 def _resolve_history_request(
     interval: Literal["minute", "day", "week", "month", "year"],
     multiplier: int,
 ) -> tuple[str, Optional[str]]:
     """Map the abstract interval to yfinance's interval plus optional resample rule."""
+    native = _NATIVE_INTERVALS.get((interval, multiplier))
+    if native is not None:
+        return native, None
+
     if interval == "minute":
-        if multiplier not in _MINUTE_INTERVALS:
-            raise ValueError(
-                "yfinance supports minute intervals of 1, 2, 5, 15, 30, 60, or 90 minutes"
-            )
-        return _MINUTE_INTERVALS[multiplier], None
-
-    if interval == "day":
-        if multiplier == 1:
-            return "1d", None
-        if multiplier == 5:
-            return "5d", None
-        return "1d", f"{multiplier}D"
-
-    if interval == "week":
-        if multiplier == 1:
-            return "1wk", None
-        return "1d", f"{multiplier}W"
-
-    if interval == "month":
-        if multiplier == 1:
-            return "1mo", None
-        if multiplier == 3:
-            return "3mo", None
-        return "1d", f"{multiplier}M"
-
-    if interval == "year":
-        return "1mo", f"{multiplier}Y"
+        raise ValueError(
+            "yfinance supports minute intervals of 1, 2, 5, 15, 30, 60, or 90 minutes"
+        )
+
+    if interval in _RESAMPLED_INTERVALS:
+        base_interval, unit = _RESAMPLED_INTERVALS[interval]
+        return base_interval, f"{multiplier}{unit}"
 
     raise ValueError(f"Unsupported interval: {interval}")
 
@@ -69,20 +95,68 @@ def _parse_iso_date(value: str) -> datetime:
         ) from exc
 
 
+# Raw histories are cached in memory so that yf_get_prices and
+# yf_get_price_performance share one download for the same window. Frames are
+# shared, so callers must not mutate them. Empty frames are not stored since
+# yfinance returns them when throttled or for unknown symbols.
+_HISTORY_CACHE_TTL_SECONDS = 600
+_HISTORY_CACHE_MAX_SIZE = 256
+_history_cache: OrderedDict[tuple[str, str, str, str], tuple[float, pd.DataFrame]] = (
+    OrderedDict()
+)
+_history_cache_lock = threading.Lock()
+
+
+def _load_history(
+    ticker: str, start_date: str, end_date: str, base_interval: str, ttl: float
+) -> pd.DataFrame:
+    """Download (or reuse) the unadjusted history for a ticker and window.
+
+    Entries live for ``ttl`` seconds, capped at ``_HISTORY_CACHE_TTL_SECONDS``.
+    """
+    key = (ticker, start_date, end_date, base_interval)
+    now = time.monotonic()
+    with _history_cache_lock:
+        cached = _history_cache.get(key)
+        if cached is not None and now < cached[0]:
+            _history_cache.move_to_end(key)
+            return cached[1]
+
+    history = get_ticker(ticker).history(
+        start=_parse_iso_date(start_date),
+        end=_parse_iso_date(end_date),
+        interval=base_interval,
+        auto_adjust=False,
+    )
+    if history.empty:
+        return history
+
+    expires_at = now + min(ttl, _HISTORY_CACHE_TTL_SECONDS)
+    with _history_cache_lock:
+        _history_cache[key] = (expires_at, history)
+        _history_cache.move_to_end(key)
+        while len(_history_cache) > _HISTORY_CACHE_MAX_SIZE:
+            _history_cache.popitem(last=False)
+    return history
+
+
+# How each history column is combined when bars are resampled
+_RESAMPLE_AGG: dict[str, str] = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum",
+    "Dividends": "sum",
+    "Stock Splits": "sum",
+}
+
+
 def _resample_prices(frame: pd.DataFrame, rule: str) -> pd.DataFrame:
     if frame.empty:
         return frame
-    agg = {
-        "Open": "first",
-        "High": "max",
-        "Low": "min",
-        "Close": "last",
-        "Adj Close": "last",
-        "Volume": "sum",
-        "Dividends": "sum",
-        "Stock Splits": "sum",
-    }
-    resampled = frame.resample(rule).agg(agg)
+    resampled = frame.resample(rule).agg(_RESAMPLE_AGG)
     resampled = resampled.dropna(how="all")
     return resampled
 
@@ -96,34 +170,91 @@ def _history_to_records(frame: pd.DataFrame) -> list[dict]:
         return []
 
     frame = frame.reset_index()
-    time_key = frame.columns[0]
-    records: list[dict] = []
-    for _, row in frame.iterrows():
-        timestamp = row[time_key]
-        if isinstance(timestamp, pd.Timestamp):
-            ts_value = timestamp.to_pydatetime().isoformat()
-        elif isinstance(timestamp, datetime):
-            ts_value = timestamp.isoformat()
-        else:
-            ts_value = str(timestamp)
-
-        records.append(
-            {
-                "timestamp": ts_value,
-                "open": to_python(row.get("Open")),
-                "high": to_python(row.get("High")),
-                "low": to_python(row.get("Low")),
-                "close": to_python(row.get("Close")),
-                "adj_close": to_python(row.get("Adj Close")),
-                "volume": to_python(row.get("Volume")),
-                "dividends": to_python(row.get("Dividends")),
-                "stock_splits": to_python(row.get("Stock Splits")),
-            }
+
+    # Convert column by column: tolist() boxes each column into Python
+    # scalars at once instead of building a Series per row
+    def column(name: str) -> list:
+        if name not in frame.columns:
+            return [None] * len(frame)
+        return [to_python(value) for value in frame[name].tolist()]
+
+    timestamps = [_format_timestamp(value) for value in frame.iloc[:, 0].tolist()]
+    return [
+        {
+            "timestamp": timestamp,
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "adj_close": adj_close,
+            "volume": volume,
+            "dividends": dividends,
+            "stock_splits": stock_splits,
+        }
+        for (
+            timestamp,
+            open_,
+            high,
+            low,
+            close,
+            adj_close,
+            volume,
+            dividends,
+            stock_splits,
+        ) in zip(
+            timestamps,
+            column("Open"),
+            column("High"),
+            column("Low"),
+            column("Close"),
+            column("Adj Close"),
+            column("Volume"),
+            column("Dividends"),
+            column("Stock Splits"),
         )
-    return records
+    ]
+
+
+def _format_timestamp(timestamp) -> str:
+    if isinstance(timestamp, pd.Timestamp):
+        return timestamp.to_pydatetime().isoformat()
+    if isinstance(timestamp, datetime):
+        return timestamp.isoformat()
+    return str(timestamp)
+
+
+# Snapshot fields and the ``info`` keys used when fast_info does not provide them
+_INFO_FALLBACK_KEYS: dict[str, str] = {
+    "currency": "currency",
+    "last_price": "regularMarketPrice",
+    "previous_close": "regularMarketPreviousClose",
+    "open": "regularMarketOpen",
+    "day_high": "regularMarketDayHigh",
+    "day_low": "regularMarketDayLow",
+    "volume": "regularMarketVolume",
+    "market_cap": "marketCap",
+}
+
+
+def _history_market_time(ticker_obj: yf.Ticker) -> Optional[int]:
+    # The chart metadata carries the same epoch timestamp as info, and is
+    # usually already loaded by fast_info
+    try:
+        metadata = ticker_obj.get_history_metadata() or {}
+    except Exception:
+        return None
+    return metadata.get("regularMarketTime")
+
+
+def _has_snapshots(response: dict) -> bool:
+    # A throttled quote comes back with every field empty
+    return all(
+        entry["snapshot"].get("last_price") is not None for entry in response.values()
+    )
 
 
 @tool(args_schema=PriceSnapshotInput)
+@cached(endpoint="price_snapshot", ttl=SNAPSHOT_TTL, should_cache=_has_snapshots)
 def yf_get_price_snapshot(tickers: list[str]) -> dict:
     """Fetch the latest Yahoo Finance quote snapshots (price, volume, market cap) for one or more tickers.
 
@@ -154,19 +285,19 @@ def yf_get_price_snapshot(tickers: list[str]) -> dict:
                 }
             )
 
-        info = getattr(ticker_obj, "info", {}) or {}
-        snapshot.setdefault("currency", info.get("currency"))
-        snapshot.setdefault("last_price", to_python(info.get("regularMarketPrice")))
-        snapshot.setdefault(
-            "previous_close", to_python(info.get("regularMarketPreviousClose"))
-        )
-        snapshot.setdefault("open", to_python(info.get("regularMarketOpen")))
-        snapshot.setdefault("day_high", to_python(info.get("regularMarketDayHigh")))
-        snapshot.setdefault("day_low", to_python(info.get("regularMarketDayLow")))
-        snapshot.setdefault("volume", to_python(info.get("regularMarketVolume")))
-        snapshot.setdefault("market_cap", to_python(info.get("marketCap")))
+        # info is a much heavier request than fast_info, so only fetch it
+        # when fast_info left a field empty
+        missing = [
+            field for field in _INFO_FALLBACK_KEYS if snapshot.get(field) is None
+        ]
+        if missing:
+            info = getattr(ticker_obj, "info", {}) or {}
+            for field in missing:
+                snapshot[field] = to_python(info.get(_INFO_FALLBACK_KEYS[field]))
+            market_time = info.get("regularMarketTime")
+        else:
+            market_time = _history_market_time(ticker_obj)
 
-        market_time = info.get("regularMarketTime")
         if isinstance(market_time, (int, float)):
             snapshot["market_time"] = datetime.fromtimestamp(market_time).isoformat()
 
@@ -178,7 +309,26 @@ def yf_get_price_snapshot(tickers: list[str]) -> dict:
     return snapshots
 
 
+def _prices_ttl(arguments: dict) -> float:
+    # Minute bars and ranges reaching the last day can still gain bars; the
+    # end date is exclusive, so a range ending yesterday may miss its last
+    # session once the day rolls over
+    end_day = _parse_iso_date(arguments["end_date"]).date()
+    if arguments["interval"] == "minute" or end_day >= date.today() - timedelta(days=1):
+        return LIVE_PRICES_TTL
+    return PRICES_TTL
+
+
+def _has_prices(response: dict) -> bool:
+    return bool(response["prices"])
+
+
+def _has_batch_prices(response: dict) -> bool:
+    return all(response.values())
+
+
 @tool(args_schema=PricesInput)
+@cached(endpoint="prices", ttl=_prices_ttl, should_cache=_has_prices)
 def yf_get_prices(
     ticker: str,
     interval: Literal["minute", "day", "week", "month", "year"],
@@ -193,16 +343,17 @@ def yf_get_prices(
     in ISO format. Use this when the agent needs price series but is configured
     to use the yfinance backend instead of FinancialDatasets.
     """
-    ticker_obj = get_ticker(ticker)
+    ticker = ticker.strip().upper()
 
     base_interval, resample_rule = _resolve_history_request(
         interval, interval_multiplier
     )
-    start = _parse_iso_date(start_date)
-    end = _parse_iso_date(end_date)
-
-    history = ticker_obj.history(
-        start=start, end=end, interval=base_interval, auto_adjust=False
+    history = _load_history(
+        ticker,
+        start_date,
+        end_date,
+        base_interval,
+        ttl=_prices_ttl({"interval": interval, "end_date": end_date}),
     )
     if resample_rule:
         history = _resample_prices(history, resample_rule)
@@ -210,7 +361,7 @@ def yf_get_prices(
     records = _history_to_records(history)
     return {
         "data_source": "yfinance",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "interval": interval,
         "interval_multiplier": interval_multiplier,
         "start_date": start_date,
@@ -219,7 +370,100 @@ def yf_get_prices(
     }
 
 
+@cached(endpoint="prices_batch", ttl=_prices_ttl, should_cache=_has_batch_prices)
+def yf_get_prices_batch(
+    tickers: list[str],
+    interval: Literal["minute", "day", "week", "month", "year"],
+    interval_multiplier: int,
+    start_date: str,
+    end_date: str,
+) -> dict[str, list[dict]]:
+    """
+    Download historical OHLCV bars for several tickers in one yfinance request.
+
+    Args:
+        tickers: Yahoo Finance ticker symbols.
+        interval: Bar interval, as in ``yf_get_prices``.
+        interval_multiplier: Interval multiplier, as in ``yf_get_prices``.
+        start_date: Start date (YYYY-MM-DD).
+        end_date: End date (YYYY-MM-DD).
+
+    Returns:
+        Mapping of each requested ticker to its price records, in the same
+        format as the ``prices`` field of ``yf_get_prices`` except that
+        timestamps are in UTC rather than the exchange's timezone. Tickers
+        without data map to an empty list.
+    """
+    if not tickers:
+        return {}
+
+    base_interval, resample_rule = _resolve_history_request(
+        interval, interval_multiplier
+    )
+    symbols = [ticker.upper() for ticker in tickers]
+
+    history = yf.download(
+        symbols,
+        start=_parse_iso_date(start_date),
+        end=_parse_iso_date(end_date),
+        interval=base_interval,
+        group_by="ticker",
+        auto_adjust=False,
+        actions=True,
+        threads=True,
+        progress=False,
+        # Daily and longer intervals default to tz-naive timestamps; keep them
+        # offset-aware like Ticker.history (download converts them to UTC)
+        ignore_tz=False,
+    )
+
+    prices_by_ticker: dict[str, list[dict]] = {}
+    available = (
+        set(history.columns.get_level_values(0))
+        if isinstance(history.columns, pd.MultiIndex)
+        else set()
+    )
+    for ticker, symbol in zip(tickers, symbols):
+        if symbol not in available:
+            prices_by_ticker[ticker] = []
+            continue
+        frame = history[symbol]
+        # Tickers on different exchanges are aligned on a shared index,
+        # so drop the rows where this ticker did not trade
+        if "Close" in frame.columns:
+            frame = frame.dropna(subset=["Close"])
+        if resample_rule:
+            frame = _resample_prices(frame, resample_rule)
+        prices_by_ticker[ticker] = _history_to_records(frame)
+    return prices_by_ticker
+
+
+def _perf_metrics(
+    prices: np.ndarray, periods_per_year: float
+) -> tuple[float, float, float]:
+    """Return max drawdown, current drawdown and annualized volatility."""
+    cumulative_max = np.maximum.accumulate(prices)
+    drawdowns = (prices - cumulative_max) / cumulative_max
+    # nanmin skips NaN like Series.min() (a zero peak gives 0/0)
+    max_drawdown = np.nanmin(drawdowns)
+
+    # Same arithmetic as pct_change(); 0/0 returns are dropped like dropna()
+    returns = prices[1:] / prices[:-1] - 1.0
+    returns = returns[~np.isnan(returns)]
+    # Sample standard deviation (ddof=1) as in Series.std(), which is
+    # undefined for a single return
+    volatility = np.nan
+    if returns.size > 1:
+        volatility = returns.std(ddof=1) * np.sqrt(periods_per_year)
+    return float(max_drawdown), float(drawdowns[-1]), float(volatility)
+
+
+def _has_performance(response: dict) -> bool:
+    return "error" not in response
+
+
 @tool(args_schema=PricesInput)
+@cached(endpoint="price_performance", ttl=_prices_ttl, should_cache=_has_performance)
 def yf_get_price_performance(
     ticker: str,
     interval: Literal["minute", "day", "week", "month", "year"],
@@ -248,16 +492,17 @@ def yf_get_price_performance(
     `interval`/`interval_multiplier` pair and respects `start_date`/`end_date`
     in ISO format.
     """
-    ticker_obj = get_ticker(ticker)
+    ticker = ticker.strip().upper()
 
     base_interval, resample_rule = _resolve_history_request(
         interval, interval_multiplier
     )
-    start = _parse_iso_date(start_date)
-    end = _parse_iso_date(end_date)
-
-    history = ticker_obj.history(
-        start=start, end=end, interval=base_interval, auto_adjust=False
+    history = _load_history(
+        ticker,
+        start_date,
+        end_date,
+        base_interval,
+        ttl=_prices_ttl({"interval": interval, "end_date": end_date}),
     )
     if resample_rule:
         history = _resample_prices(history, resample_rule)
@@ -265,7 +510,7 @@ def yf_get_price_performance(
     if history.empty:
         return {
             "data_source": "yfinance",
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "interval": interval,
             "interval_multiplier": interval_multiplier,
             "start_date": start_date,
@@ -278,7 +523,7 @@ def yf_get_price_performance(
     if len(prices) == 0:
         return {
             "data_source": "yfinance",
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "interval": interval,
             "interval_multiplier": interval_multiplier,
             "start_date": start_date,
@@ -286,148 +531,102 @@ def yf_get_price_performance(
             "error": "No adjusted close prices available",
         }
 
+    # Every metric below reads this one float64 array; the index is only
+    # used for dates and to locate the windows
+    values = prices.to_numpy(dtype=np.float64, copy=False)
+    dates = prices.index
+
     # Calculate total return (start to end)
-    start_price = prices.iloc[0]
-    end_price = prices.iloc[-1]
+    start_price = values[0]
+    end_price = values[-1]
     total_return = (end_price - start_price) / start_price
 
     # Calculate total annualized return
-    start_dt = prices.index[0]
-    end_dt_for_calc = prices.index[-1]
-    days_elapsed = (end_dt_for_calc - start_dt).days
+    end_dt = dates[-1]
+    days_elapsed = (end_dt - dates[0]).days
     if days_elapsed > 0:
         years_elapsed = days_elapsed / 365.25
-        total_annualized_return = to_python(
-            ((1 + total_return) ** (1 / years_elapsed)) - 1
-        )
+        total_annualized_return = ((1 + total_return) ** (1 / years_elapsed)) - 1
     else:
-        total_annualized_return = None
-
-    total_return = to_python(total_return)
-
-    # Calculate periodic returns
-    periodic_returns = {}
-    end_dt = prices.index[-1]
-
-    # 1 day return
-    one_day_ago = end_dt - timedelta(days=1)
-    day_prices = prices[prices.index >= one_day_ago]
-    if len(day_prices) >= 2:
-        periodic_returns["1d"] = to_python(
-            (day_prices.iloc[-1] - day_prices.iloc[0]) / day_prices.iloc[0]
-        )
-
-    # 1 week return
-    one_week_ago = end_dt - timedelta(days=7)
-    week_prices = prices[prices.index >= one_week_ago]
-    if len(week_prices) >= 2:
-        periodic_returns["1w"] = to_python(
-            (week_prices.iloc[-1] - week_prices.iloc[0]) / week_prices.iloc[0]
-        )
-
-    # 1 month return
-    one_month_ago = end_dt - timedelta(days=30)
-    month_prices = prices[prices.index >= one_month_ago]
-    if len(month_prices) >= 2:
-        periodic_returns["1m"] = to_python(
-            (month_prices.iloc[-1] - month_prices.iloc[0]) / month_prices.iloc[0]
-        )
-
-    # 3 month return
-    three_months_ago = end_dt - timedelta(days=90)
-    three_month_prices = prices[prices.index >= three_months_ago]
-    if len(three_month_prices) >= 2:
-        periodic_returns["3m"] = to_python(
-            (three_month_prices.iloc[-1] - three_month_prices.iloc[0])
-            / three_month_prices.iloc[0]
-        )
-
-    # 6 month return
-    six_months_ago = end_dt - timedelta(days=180)
-    six_month_prices = prices[prices.index >= six_months_ago]
-    if len(six_month_prices) >= 2:
-        periodic_returns["6m"] = to_python(
-            (six_month_prices.iloc[-1] - six_month_prices.iloc[0])
-            / six_month_prices.iloc[0]
-        )
-
-    # 1 year return
-    one_year_ago = end_dt - timedelta(days=365)
-    one_year_prices = prices[prices.index >= one_year_ago]
-    if len(one_year_prices) >= 2:
-        periodic_returns["1y"] = to_python(
-            (one_year_prices.iloc[-1] - one_year_prices.iloc[0])
-            / one_year_prices.iloc[0]
-        )
-
-    # 3 year return
-    three_years_ago = end_dt - timedelta(days=1095)
-    three_year_prices = prices[prices.index >= three_years_ago]
-    if len(three_year_prices) >= 2:
-        periodic_returns["3y"] = to_python(
-            (three_year_prices.iloc[-1] - three_year_prices.iloc[0])
-            / three_year_prices.iloc[0]
-        )
-
-    # 5 year return
-    five_years_ago = end_dt - timedelta(days=1825)
-    five_year_prices = prices[prices.index >= five_years_ago]
-    if len(five_year_prices) >= 2:
-        periodic_returns["5y"] = to_python(
-            (five_year_prices.iloc[-1] - five_year_prices.iloc[0])
-            / five_year_prices.iloc[0]
-        )
-
-    # Year-to-date return - use pd.Timestamp to preserve timezone
-    ytd_start = pd.Timestamp(year=end_dt.year, month=1, day=1, tz=end_dt.tz)
-    ytd_prices = prices[prices.index >= ytd_start]
-    if len(ytd_prices) >= 2:
-        periodic_returns["ytd"] = to_python(
-            (ytd_prices.iloc[-1] - ytd_prices.iloc[0]) / ytd_prices.iloc[0]
+        total_annualized_return = np.nan
+
+    # Calculate periodic returns: a single searchsorted finds where every
+    # window starts (the first price on or after its cutoff)
+    window_cutoffs = {
+        "1d": end_dt - timedelta(days=1),
+        "1w": end_dt - timedelta(days=7),
+        "1m": end_dt - timedelta(days=30),
+        "3m": end_dt - timedelta(days=90),
+        "6m": end_dt - timedelta(days=180),
+        "1y": end_dt - timedelta(days=365),
+        "3y": end_dt - timedelta(days=1095),
+        "5y": end_dt - timedelta(days=1825),
+        # Year-to-date - use pd.Timestamp to preserve timezone
+        "ytd": pd.Timestamp(year=end_dt.year, month=1, day=1, tz=end_dt.tz),
+    }
+    window_starts = dates.searchsorted(list(window_cutoffs.values()))
+
+    # A window needs at least two prices to have a return
+    has_return = window_starts < len(values) - 1
+    start_values = values[window_starts[has_return]]
+    periodic_returns = dict(
+        zip(
+            [label for label, ok in zip(window_cutoffs, has_return) if ok],
+            ((values[-1] - start_values) / start_values).tolist(),
         )
+    )
 
     # Calculate 52-week range
-    fifty_two_weeks_ago = end_dt - timedelta(days=365)
-    week_52_prices = prices[prices.index >= fifty_two_weeks_ago]
+    week_52_prices = values[dates.searchsorted(window_cutoffs["1y"]) :]
     if len(week_52_prices) > 0:
-        week_52_high = to_python(week_52_prices.max())
-        week_52_low = to_python(week_52_prices.min())
+        week_52_high = week_52_prices.max()
+        week_52_low = week_52_prices.min()
     else:
-        week_52_high = None
-        week_52_low = None
-
-    # Calculate drawdowns
-    cumulative_max = prices.expanding().max()
-    drawdowns = (prices - cumulative_max) / cumulative_max
-    max_drawdown = to_python(drawdowns.min())
-    current_drawdown = to_python(drawdowns.iloc[-1])
-
-    # Calculate annualized volatility
-    if len(prices) > 1:
-        returns = prices.pct_change().dropna()
-
-        # Determine annualization factor based on interval
-        if interval == "minute":
-            # Assume 6.5 trading hours per day, 252 trading days per year
-            periods_per_year = 252 * 6.5 * 60 / interval_multiplier
-        elif interval == "day":
-            periods_per_year = 252 / interval_multiplier
-        elif interval == "week":
-            periods_per_year = 52 / interval_multiplier
-        elif interval == "month":
-            periods_per_year = 12 / interval_multiplier
-        elif interval == "year":
-            periods_per_year = 1 / interval_multiplier
-        else:
-            periods_per_year = 252
+        week_52_high = np.nan
+        week_52_low = np.nan
+
+    # Calculate drawdowns and annualized volatility
+    periods_per_year = (
+        _PERIODS_PER_YEAR[interval] / interval_multiplier
+        if interval in _PERIODS_PER_YEAR
+        else 252
+    )
+    max_drawdown, current_drawdown, volatility = _perf_metrics(
+        values, float(periods_per_year)
+    )
 
-        volatility = to_python(returns.std() * np.sqrt(periods_per_year))
-    else:
-        volatility = None
+    # Box all scalar metrics with a single tolist(); NaN marks a missing value
+    (
+        start_price,
+        end_price,
+        total_return,
+        total_annualized_return,
+        week_52_high,
+        week_52_low,
+        max_drawdown,
+        current_drawdown,
+        volatility,
+    ) = [
+        None if value != value else value
+        for value in np.array(
+            [
+                start_price,
+                end_price,
+                total_return,
+                total_annualized_return,
+                week_52_high,
+                week_52_low,
+                max_drawdown,
+                current_drawdown,
+                volatility,
+            ],
+            dtype=np.float64,
+        ).tolist()
+    ]
 
     return {
         "data_source": "yfinance",
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "interval": interval,
         "interval_multiplier": interval_multiplier,
         "start_date": start_date,
@@ -12,6 +12,9 @@ import yfinance as yf
 
 def get_ticker(symbol: str) -> yf.Ticker:
     """Return a yfinance ``Ticker`` instance for the given symbol."""
+    # No session is passed on purpose: yfinance keeps a single process-wide
+    # curl_cffi session (shared by every Ticker, so connections are reused)
+    # and rejects plain requests.Session objects
     return yf.Ticker(symbol.upper())
 
 
@@ -24,13 +27,16 @@ def frame_to_records(frame: pd.DataFrame | None, limit: Optional[int] = None) ->
     if limit is not None:
         columns = columns[:limit]
 
+    # Row labels are shared by every period, and tolist() boxes a whole
+    # column into Python scalars at once
+    labels = [str(index) for index in frame.index]
     records: list[dict] = []
     for column in columns:
-        series = frame[column]
         record = {
             "period": format_period_label(column),
             "values": {
-                str(index): to_python(value) for index, value in series.items()
+                label: to_python(value)
+                for label, value in zip(labels, frame[column].tolist())
             },
         }
         records.append(record)
@@ -62,6 +68,9 @@ def to_python(value):
     """Convert pandas/numpy scalars into plain Python types."""
     if value is None:
         return None
+    if type(value) is float:
+        # Fast path for statement values; NaN is the only float unequal to itself
+        return None if value != value else value
     if isinstance(value, (pd.Timestamp, datetime)):
         return value.isoformat()
     try:
@@ -96,31 +105,76 @@ def apply_period_filters(
     if not records or not any([report_period_gt, report_period_gte, report_period_lt, report_period_lte]):
         return records
 
-    gt_date = _parse_iso_date(report_period_gt)
-    gte_date = _parse_iso_date(report_period_gte)
-    lt_date = _parse_iso_date(report_period_lt)
-    lte_date = _parse_iso_date(report_period_lte)
-
-    filtered: list[dict] = []
-    for record in records:
-        period_str = record.get("period")
-        period_date = _parse_iso_date(period_str) if isinstance(period_str, str) else None
-
-        if period_date is None:
-            filtered.append(record)
-            continue
-
-        if gt_date and period_date <= gt_date:
-            continue
-        if gte_date and period_date < gte_date:
-            continue
-        if lt_date and period_date >= lt_date:
-            continue
-        if lte_date and period_date > lte_date:
-            continue
-
-        filtered.append(record)
-    return filtered
+    bounds = _parse_period_bounds(
+        report_period_gt, report_period_gte, report_period_lt, report_period_lte
+    )
+    return [
+        record
+        for record in records
+        if _period_in_bounds(record.get("period"), *bounds)
+    ]
+
+
+def filter_period_columns(
+    frame: pd.DataFrame | None,
+    report_period_gt: Optional[str] = None,
+    report_period_gte: Optional[str] = None,
+    report_period_lt: Optional[str] = None,
+    report_period_lte: Optional[str] = None,
+) -> pd.DataFrame | None:
+    """Keep the statement columns whose period lies within the boundaries.
+
+    Same semantics as ``apply_period_filters``, applied to a DataFrame's
+    period columns so records are only built for the periods kept.
+    """
+    if frame is None or frame.empty or not any(
+        [report_period_gt, report_period_gte, report_period_lt, report_period_lte]
+    ):
+        return frame
+
+    bounds = _parse_period_bounds(
+        report_period_gt, report_period_gte, report_period_lt, report_period_lte
+    )
+    mask = [
+        _period_in_bounds(format_period_label(column), *bounds)
+        for column in frame.columns
+    ]
+    return frame.loc[:, mask]
+
+
+def _parse_period_bounds(
+    gt: Optional[str], gte: Optional[str], lt: Optional[str], lte: Optional[str]
+) -> tuple[Optional[datetime], ...]:
+    return (
+        _parse_iso_date(gt),
+        _parse_iso_date(gte),
+        _parse_iso_date(lt),
+        _parse_iso_date(lte),
+    )
+
+
+def _period_in_bounds(
+    period_str,
+    gt_date: Optional[datetime],
+    gte_date: Optional[datetime],
+    lt_date: Optional[datetime],
+    lte_date: Optional[datetime],
+) -> bool:
+    period_date = _parse_iso_date(period_str) if isinstance(period_str, str) else None
+
+    # Periods without a parsable date are always kept
+    if period_date is None:
+        return True
+
+    if gt_date and period_date <= gt_date:
+        return False
+    if gte_date and period_date < gte_date:
+        return False
+    if lt_date and period_date >= lt_date:
+        return False
+    if lte_date and period_date > lte_date:
+        return False
+    return True
 
 
 def _parse_iso_date(value: Optional[str]) -> Optional[datetime]:
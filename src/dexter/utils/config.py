@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 from pathlib import Path
@@ -5,6 +6,22 @@ from typing import Any, Dict, Optional
 
 SETTINGS_FILE = Path(".dexter/settings.json")
 
+
+@functools.cache
+def load_dotenv_if_needed() -> None:
+    """
+    Load the .env file once per process.
+
+    Both the CLI and the context manager call this at import, so .env is
+    located and parsed only once. Variables already set in the environment
+    are never overridden, so keys exported in the shell coexist with the
+    rest of the settings in .env.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 def load_config() -> Dict[str, Any]:
     """
     Load configuration from .dexter/settings.json.
@@ -8,12 +8,11 @@ from langsmith import trace
 from pathlib import Path
 from pydantic import BaseModel
 from typing import List, Literal, Dict, Any, Optional
-from dotenv import load_dotenv
-
 from dexter.model import call_llm, MODEL_PROVIDER
 from dexter.prompts import DEFAULT_SYSTEM_PROMPT, CONTEXT_SELECTION_SYSTEM_PROMPT
+from dexter.utils.config import load_dotenv_if_needed
 
-load_dotenv()
+load_dotenv_if_needed()
 
 
 class ContextManager:
@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Optional
 from dotenv import dotenv_values
 
-from dexter.model import MODEL_PROVIDER
+from dexter.model import MODEL_PROVIDER, get_chat_model
 
 
 # Map model IDs to their required API key environment variable names
@@ -140,6 +140,9 @@ def save_api_key_to_env(api_key_name: str, api_key_value: str) -> bool:
 
         load_dotenv(override=True)
 
+        # Cached chat models were built with the previous environment
+        get_chat_model.cache_clear()
+
         return True
     except Exception as e:
         print(f"Error saving API key to .env file: {e}")
@@ -0,0 +1,69 @@
+import copy
+import hashlib
+import json
+import os
+
+from collections import OrderedDict
+from typing import Any, List, Optional, Type
+
+from pydantic import BaseModel
+from langchain_core.tools import BaseTool
+
+# In-process cache of deterministic (temperature=0) LLM responses.
+# Enable with DEXTER_LLM_CACHE=1.
+MAX_CACHE_SIZE = 256
+
+_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def is_llm_cache_enabled() -> bool:
+    """Return True if LLM response caching is enabled via DEXTER_LLM_CACHE."""
+    return os.getenv("DEXTER_LLM_CACHE", "0").lower() in ("1", "true")
+
+
+def make_cache_key(
+    model: str,
+    model_type: str,
+    system_prompt: str,
+    prompt: str,
+    output_schema: Optional[Type[BaseModel]] = None,
+    tools: Optional[List[BaseTool]] = None,
+) -> str:
+    """Build an exact-match key for an LLM request payload."""
+    payload = {
+        "model": model,
+        "model_type": model_type,
+        "sys": system_prompt,
+        "prompt": prompt,
+        "schema": output_schema.__name__ if output_schema else None,
+        "tools": sorted(t.name for t in tools or []),
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[Any]:
+    """
+    Return a copy of the cached response for key, or None on a miss.
+
+    A deep copy is returned because callers mutate responses (e.g. marking
+    planned tasks as done).
+    """
+    if key not in _cache:
+        return None
+    _cache.move_to_end(key)
+    return copy.deepcopy(_cache[key])
+
+
+def cache_response(key: str, response: Any) -> None:
+    """Store a response, evicting the least recently used entry when full."""
+    _cache[key] = copy.deepcopy(response)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+def clear_llm_cache() -> None:
+    """Drop all cached responses."""
+    _cache.clear()
@@ -30,6 +30,36 @@ MODELS = [
     },
 ]
 
+# Static parts of the selector menu, built once
+_HEADER_FRAGMENTS = [
+    ("class:title", "Select model provider\n"),
+    (
+        "class:subtitle",
+        "Switch between LLM model providers. Applies to this session and future sessions.\n",
+    ),
+    ("", "\n"),
+]
+_FOOTER_FRAGMENTS = [
+    ("", "\n"),
+    ("class:footer", "Enter to confirm · Esc to exit"),
+]
+# "<number>.  <model names> · <description>" for each option
+_MODEL_LABELS = [
+    f"{i + 1}.  {model['display_name']} · {model['description']}"
+    for i, model in enumerate(MODELS)
+]
+
+# Style matching the screenshot
+_STYLE = Style.from_dict(
+    {
+        "title": "#58A6FF bold",  # Light blue
+        "subtitle": "#888888",  # Grey
+        "model": "#58A6FF",  # Light blue
+        "model.selected": "#a5cfff bold",  # Lighter blue bold
+        "footer": "#888888",  # Grey
+    }
+)
+
 
 def select_model_provider(
     current_model_provider: Optional[MODEL_PROVIDER] = None,
@@ -54,57 +84,24 @@ def select_model_provider(
     # Create key bindings
     kb = KeyBindings()
 
+    # Only the selection marker changes between renders, so each row's text
+    # (including the checkmark for the current provider) is built once
+    rows = []
+    for label, model in zip(_MODEL_LABELS, MODELS):
+        # Show checkmark if this is the currently selected model
+        checkmark = " ✓" if current_model_provider == model["model_provider"] else ""
+        rows.append(f"{label}{checkmark}\n")
+
     def get_formatted_text():
         """Generate the formatted text for the menu."""
-        fragments = []
-
-        # Title
-        fragments.append(("class:title", "Select model provider\n"))
-        fragments.append(
-            (
-                "class:subtitle",
-                "Switch between LLM model providers. Applies to this session and future sessions.\n",
-            )
-        )
-        fragments.append(("", "\n"))
-
-        # Model options
-        for i, model in enumerate(MODELS):
-            prefix = "> " if i == selected_index else "  "
-            # Show checkmark if this is the currently selected model
-            checkmark = (
-                " ✓"
-                if current_model_provider
-                and current_model_provider == model["model_provider"]
-                else ""
-            )
-
-            # Number
-            number = f"{i + 1}.  "
-
-            # Model provider name
-            name = model["display_name"]
-
-            # Description
-            desc = f" · {model['description']}"
-
-            # Style based on selection
-            if i == selected_index:
-                fragments.append(
-                    (
-                        "class:model.selected",
-                        f"{prefix}{number}{name}{desc}{checkmark}\n",
-                    )
-                )
-            else:
-                fragments.append(
-                    ("class:model", f"{prefix}{number}{name}{desc}{checkmark}\n")
-                )
-
-        fragments.append(("", "\n"))
-        fragments.append(("class:footer", "Enter to confirm · Esc to exit"))
-
-        return FormattedText(fragments)
+        # Model options, styled based on selection
+        options = [
+            ("class:model.selected", f"> {row}")
+            if i == selected_index
+            else ("class:model", f"  {row}")
+            for i, row in enumerate(rows)
+        ]
+        return FormattedText(_HEADER_FRAGMENTS + options + _FOOTER_FRAGMENTS)
 
     # Create formatted text control with a callable that captures current state
     formatted_text_control = FormattedTextControl(get_formatted_text, show_cursor=False)
@@ -115,17 +112,6 @@ def select_model_provider(
 
     layout = Layout(HSplit([text_window]))
 
-    # Style matching the screenshot
-    style = Style.from_dict(
-        {
-            "title": "#58A6FF bold",  # Light blue
-            "subtitle": "#888888",  # Grey
-            "model": "#58A6FF",  # Light blue
-            "model.selected": "#a5cfff bold",  # Lighter blue bold
-            "footer": "#888888",  # Grey
-        }
-    )
-
     # Key bindings
     @kb.add("up")
     @kb.add("k")
@@ -155,7 +141,7 @@ def select_model_provider(
     app = Application(
         layout=layout,
         key_bindings=kb,
-        style=style,
+        style=_STYLE,
         full_screen=False,
     )
 
@@ -0,0 +1,66 @@
+import orjson
+import pytest
+import requests
+
+from dexter.tools.finance import api
+from dexter.tools.finance import prices
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    monkeypatch.setattr(api, "batch_endpoints_enabled", True)
+    single_calls = []
+
+    def call_api(endpoint, params):
+        single_calls.append(params["ticker"])
+        return {"snapshot": {"ticker": params["ticker"], "price": 1.0}}
+
+    monkeypatch.setattr(prices, "call_api", call_api)
+
+    def install(batch):
+        monkeypatch.setattr(prices, "call_api_batch", batch)
+        return single_calls
+
+    return install
+
+
+def _snapshot(tickers):
+    return prices.get_price_snapshot.invoke({"tickers": tickers})
+
+
+def test_batch_response_is_split_per_ticker(fake_api):
+    single_calls = fake_api(
+        lambda endpoint, payload: {"snapshots": {"AAPL": {"price": 2.0}}}
+    )
+
+    result = _snapshot(["AAPL", "MSFT"])
+
+    assert result == {"AAPL": {"price": 2.0}, "MSFT": {}}
+    assert single_calls == []
+
+
+def _raise_http_error(endpoint, payload):
+    raise requests.HTTPError("403 Forbidden")
+
+
+def _raise_decode_error(endpoint, payload):
+    return orjson.loads(b"<html>maintenance</html>")
+
+
+@pytest.mark.parametrize(
+    "batch",
+    [
+        _raise_http_error,
+        _raise_decode_error,
+        lambda endpoint, payload: {"error": "unsupported"},
+        lambda endpoint, payload: [],
+    ],
+)
+def test_falls_back_to_per_ticker_requests(fake_api, batch):
+    single_calls = fake_api(batch)
+
+    result = _snapshot(["AAPL", "MSFT"])
+
+    assert result["AAPL"] == {"ticker": "AAPL", "price": 1.0}
+    assert result["MSFT"] == {"ticker": "MSFT", "price": 1.0}
+    assert sorted(single_calls) == ["AAPL", "MSFT"]
@@ -0,0 +1,47 @@
+import pytest
+
+from dexter.tools.search import tavily
+
+
+class _StubTavily:
+    def __init__(self, results):
+        self.results = list(results)
+        self.queries = []
+
+    def invoke(self, payload):
+        self.queries.append(payload["query"])
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def stub_tavily(monkeypatch):
+    monkeypatch.setattr(tavily, "_search_cache", type(tavily._search_cache)())
+
+    def install(*results):
+        stub = _StubTavily(results)
+        monkeypatch.setattr(tavily, "_ensure_tavily_initialized", lambda: stub)
+        return stub
+
+    return install
+
+
+def test_cached_search_serves_repeats_from_memory(stub_tavily):
+    stub = stub_tavily({"results": [1]})
+
+    assert tavily._cached_search("AAPL news") == {"results": [1]}
+    assert tavily._cached_search("AAPL news") == {"results": [1]}
+    assert stub.queries == ["AAPL news"]
+
+
+def test_cached_search_does_not_cache_errors(stub_tavily):
+    error = {"error": ConnectionError("timed out")}
+    stub = stub_tavily(error, {"results": [1]})
+
+    assert tavily._cached_search("AAPL news") is error
+    assert tavily._cached_search("AAPL news") == {"results": [1]}
+    assert stub.queries == ["AAPL news", "AAPL news"]
+
+
+def test_time_context():
+    assert tavily._time_context("not a date") == "recent"
+    assert tavily._time_context("2000-01-03") == "around 2000-01-03"
@@ -0,0 +1,141 @@
+import pytest
+
+from langchain_core.messages import AIMessage
+
+from dexter import agent as agent_module
+from dexter import model as model_module
+from dexter.agent import Agent
+from dexter.schemas import OptimizedToolArgs, Task
+
+TOOL_CALLS = [
+    {"name": "yf_get_prices", "args": {"ticker": "AAPL"}},
+    {"name": "not_a_tool", "args": {"query": "unchanged"}},
+    {"name": "yf_get_income_statements", "args": {"ticker": "MSFT"}},
+]
+
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    return Agent(data_source="yfinance")
+
+
+@pytest.fixture
+def individual_calls(monkeypatch):
+    """Stub the per-call optimizer; it tags each tool's args as optimized."""
+    prompts = []
+
+    def call_llm(prompt, **kwargs):
+        prompts.append(prompt)
+        tool_name = prompt.split("Tool: ", 1)[1].split("\n", 1)[0]
+        return OptimizedToolArgs(arguments={"optimized": tool_name})
+
+    monkeypatch.setattr(agent_module, "call_llm", call_llm)
+    return prompts
+
+
+def _stub_batched_llm(monkeypatch, results):
+    prompts = []
+
+    def call_llm(prompt, **kwargs):
+        prompts.append(prompt)
+        return {"results": results}
+
+    monkeypatch.setattr(model_module, "call_llm", call_llm)
+    return prompts
+
+
+def test_batch_preserves_order_and_keeps_unknown_tool_args(
+    agent, monkeypatch, individual_calls
+):
+    batch_prompts = _stub_batched_llm(
+        monkeypatch,
+        [
+            {"arguments": {"ticker": "AAPL", "interval": "day"}},
+            {"arguments": {"ticker": "MSFT", "period": "annual"}},
+        ],
+    )
+
+    optimized = agent.optimize_tool_args_batch(TOOL_CALLS, "Compare AAPL and MSFT")
+
+    assert optimized == [
+        {"ticker": "AAPL", "interval": "day"},
+        {"query": "unchanged"},
+        {"ticker": "MSFT", "period": "annual"},
+    ]
+    assert len(batch_prompts) == 1
+    prompt = batch_prompts[0]
+    assert "not_a_tool" not in prompt
+    assert (
+        prompt.index("Question 1")
+        < prompt.index("Tool: yf_get_prices")
+        < prompt.index("Question 2")
+        < prompt.index("Tool: yf_get_income_statements")
+    )
+    assert individual_calls == []
+
+
+def test_batch_result_count_mismatch_falls_back_to_individual_calls(
+    agent, monkeypatch, individual_calls
+):
+    _stub_batched_llm(monkeypatch, [{"arguments": {"ticker": "AAPL"}}])
+
+    optimized = agent.optimize_tool_args_batch(TOOL_CALLS, "Compare AAPL and MSFT")
+
+    assert optimized == [
+        {"optimized": "yf_get_prices"},
+        {"query": "unchanged"},
+        {"optimized": "yf_get_income_statements"},
+    ]
+    assert len(individual_calls) == 2
+
+
+def test_batch_keeps_args_when_no_tool_is_known(agent, monkeypatch, individual_calls):
+    batch_prompts = _stub_batched_llm(monkeypatch, [])
+    tool_calls = [TOOL_CALLS[1], {"name": "other", "args": {"a": 1}}]
+
+    assert agent.optimize_tool_args_batch(tool_calls, "task") == [
+        {"query": "unchanged"},
+        {"a": 1},
+    ]
+    assert batch_prompts == []
+    assert individual_calls == []
+
+
+def test_call_llm_batched_raises_on_result_count_mismatch(monkeypatch):
+    _stub_batched_llm(monkeypatch, [OptimizedToolArgs(arguments={})])
+
+    with pytest.raises(ValueError, match="Expected 2 batched results, got 1"):
+        model_module.call_llm_batched(["a", "b"], output_schema=OptimizedToolArgs)
+
+
+def test_run_only_optimizes_calls_within_the_step_budget(agent, monkeypatch):
+    optimized_batches = []
+
+    def optimize_tool_args_batch(tool_calls, task_desc):
+        optimized_batches.append([tool_call["name"] for tool_call in tool_calls])
+        return [tool_call["args"] for tool_call in tool_calls]
+
+    agent.max_steps = 2
+    monkeypatch.setattr(
+        agent, "plan_tasks", lambda query: [Task(id=1, description="task")]
+    )
+    monkeypatch.setattr(
+        agent,
+        "ask_for_actions",
+        lambda *args, **kwargs: AIMessage(
+            content="",
+            tool_calls=[
+                {"name": tool_call["name"], "args": tool_call["args"], "id": str(i)}
+                for i, tool_call in enumerate(TOOL_CALLS)
+            ],
+        ),
+    )
+    monkeypatch.setattr(agent, "optimize_tool_args_batch", optimize_tool_args_batch)
+    monkeypatch.setattr(agent, "_execute_tool", lambda *args: {})
+    monkeypatch.setattr(agent, "ask_if_done", lambda *args: True)
+    monkeypatch.setattr(agent, "is_goal_achieved", lambda *args: True)
+    monkeypatch.setattr(agent, "_generate_answer", lambda *args: "answer")
+
+    assert agent.run("query") == "answer"
+    assert optimized_batches == [["yf_get_prices", "not_a_tool"]]
@@ -0,0 +1,67 @@
+import pytest
+
+from dexter.model import _get_template
+from dexter.prompts import (
+    ACTION_SYSTEM_PROMPT,
+    CONTEXT_SELECTION_SYSTEM_PROMPT,
+    DEFAULT_SYSTEM_PROMPT,
+    META_VALIDATION_SYSTEM_PROMPT,
+    PLANNING_SYSTEM_PROMPT,
+    VALIDATION_SYSTEM_PROMPT,
+    get_answer_system_prompt,
+    get_tool_args_system_prompt,
+)
+
+SYSTEM_PROMPTS = {
+    "default": DEFAULT_SYSTEM_PROMPT,
+    "planning": PLANNING_SYSTEM_PROMPT.format(tools="- yf_get_prices: prices"),
+    "action": ACTION_SYSTEM_PROMPT,
+    "validation": VALIDATION_SYSTEM_PROMPT,
+    "meta_validation": META_VALIDATION_SYSTEM_PROMPT,
+    "tool_args": get_tool_args_system_prompt(),
+    "answer": get_answer_system_prompt(),
+    "context_selection": CONTEXT_SELECTION_SYSTEM_PROMPT,
+}
+
+
+def _system_text(message) -> str:
+    if isinstance(message.content, str):
+        return message.content
+    return "".join(block["text"] for block in message.content)
+
+
+@pytest.mark.parametrize("model", ["openai", "anthropic", "gemini"])
+@pytest.mark.parametrize("name", SYSTEM_PROMPTS)
+def test_get_template_renders_system_prompt_braces_once(name, model):
+    messages = (
+        _get_template(SYSTEM_PROMPTS[name], model)
+        .invoke({"prompt": "What is AAPL's revenue?"})
+        .messages
+    )
+
+    system_text = _system_text(messages[0])
+    assert "{{" not in system_text
+    assert "}}" not in system_text
+    assert messages[1].content == "What is AAPL's revenue?"
+
+
+def test_get_template_renders_json_examples():
+    validation = _get_template(VALIDATION_SYSTEM_PROMPT, "openai").invoke(
+        {"prompt": ""}
+    )
+    tool_args = _get_template(get_tool_args_system_prompt(), "openai").invoke(
+        {"prompt": ""}
+    )
+
+    assert '{"done": true}' in _system_text(validation.messages[0])
+    assert '"arguments": {' in _system_text(tool_args.messages[0])
+
+
+def test_get_template_marks_anthropic_system_prompt_cacheable():
+    message = (
+        _get_template(VALIDATION_SYSTEM_PROMPT, "anthropic")
+        .invoke({"prompt": ""})
+        .messages[0]
+    )
+
+    assert message.content[0]["cache_control"] == {"type": "ephemeral"}
@@ -0,0 +1,73 @@
+import json
+
+from dexter.tools.yfinance.agent.stanley_druckenmiller import (
+    StanleyDruckenmillerAgent,
+    analyze_growth_and_momentum,
+    analyze_insider_activity,
+    analyze_risk_reward,
+    analyze_sentiment,
+    analyze_valuation,
+)
+
+FINANCIALS = [
+    {
+        "revenue": 120.0,
+        "earnings_per_share": 2.4,
+        "total_debt": 30.0,
+        "shareholders_equity": 100.0,
+        "net_income": 20.0,
+        "free_cash_flow": 25.0,
+        "ebit": 30.0,
+        "ebitda": 40.0,
+        "cash_and_equivalents": 10.0,
+    },
+    {
+        "revenue": 100.0,
+        "earnings_per_share": 2.0,
+        "total_debt": 35.0,
+        "shareholders_equity": 90.0,
+    },
+]
+PRICES = [{"close": 100.0 + i} for i in range(40)]
+
+
+def test_analyzers_return_string_details():
+    results = [
+        analyze_growth_and_momentum(FINANCIALS, PRICES),
+        analyze_risk_reward(FINANCIALS, PRICES),
+        analyze_valuation(FINANCIALS, 400.0),
+        analyze_insider_activity([{"transaction_shares": 10}]),
+        analyze_sentiment([{"title": "Record quarter"}]),
+    ]
+
+    for result in results:
+        assert isinstance(result["details"], str)
+        json.dumps(result)
+
+    assert results[0]["details"].startswith("Strong annualized revenue growth: 20.0%")
+    assert results[3]["details"] == "Heavy insider buying: 1 buys vs. 0 sells"
+
+
+def test_agent_details_can_be_omitted():
+    analysis = StanleyDruckenmillerAgent(include_details=False).analyze(
+        "AAPL", FINANCIALS, PRICES, 400.0, [], []
+    )
+
+    assert analysis["valuation_analysis"] == {
+        "score": analyze_valuation(FINANCIALS, 400.0)["score"]
+    }
+    json.dumps(analysis)
+
+
+def test_risk_reward_volatility_skips_non_positive_previous_closes():
+    closes = [100.0, 0.0, 101.0] + [100.0 + (i % 2) for i in range(12)]
+    prices = [{"close": close} for close in closes]
+
+    result = analyze_risk_reward(FINANCIALS, prices)
+
+    returns = [
+        (close - prev) / prev for prev, close in zip(closes, closes[1:]) if prev > 0
+    ]
+    mean = sum(returns) / len(returns)
+    stdev = (sum((r - mean) ** 2 for r in returns) / len(returns)) ** 0.5
+    assert f"daily returns stdev {stdev:.2%}" in result["details"]
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pytest
+
+from dexter.tools.yfinance.agent import base
+from dexter.tools.yfinance.agent import stanley_druckenmiller as sd
+
+
+@pytest.fixture
+def stub_analysis(monkeypatch):
+    """Stub run_financial_analysis; tickers in `incomplete` had failed fetches."""
+    sd.clear_cache()
+    runs = []
+    incomplete_tickers = set()
+
+    def run_financial_analysis(tickers, agents, incomplete=None):
+        runs.append(list(tickers))
+        if incomplete is not None:
+            incomplete.update(set(tickers) & incomplete_tickers)
+        return {
+            ticker: {agents[0].name: {"signal": "Hold", "score": 5.0}}
+            for ticker in tickers
+        }
+
+    monkeypatch.setattr(sd, "run_financial_analysis", run_financial_analysis)
+    yield runs, incomplete_tickers
+    sd.clear_cache()
+
+
+def test_results_are_cached_per_ticker(stub_analysis):
+    runs, _ = stub_analysis
+
+    sd.stanley_druckenmiller_agent.func(tickers=["AAPL"])
+    sd.stanley_druckenmiller_agent.func(tickers=["AAPL", "MSFT"])
+
+    assert runs == [["AAPL"], ["MSFT"]]
+
+
+def test_results_from_incomplete_data_are_not_cached(stub_analysis):
+    runs, incomplete_tickers = stub_analysis
+    incomplete_tickers.add("FAIL")
+
+    sd.stanley_druckenmiller_agent.func(tickers=["AAPL", "FAIL"])
+    sd.stanley_druckenmiller_agent.func(tickers=["AAPL", "FAIL"])
+
+    assert runs == [["AAPL", "FAIL"], ["FAIL"]]
+
+
+def test_cached_results_are_returned_as_copies(stub_analysis):
+    first = sd.stanley_druckenmiller_agent.func(tickers=["AAPL"])
+    first["AAPL"]["signal"] = "Mutated"
+
+    second = sd.stanley_druckenmiller_agent.func(tickers=["AAPL"])
+    second["AAPL"]["score"] = 0
+
+    assert sd.stanley_druckenmiller_agent.func(tickers=["AAPL"])["AAPL"] == {
+        "signal": "Hold",
+        "score": 5.0,
+    }
+
+
+def test_run_financial_analysis_reports_incomplete_tickers(monkeypatch):
+    financials = {"AAPL": [{"revenue": 1.0}], "FAIL": []}
+    monkeypatch.setattr(
+        base,
+        "yf_search_line_items",
+        lambda ticker, **kwargs: financials[ticker],
+    )
+    monkeypatch.setattr(base, "yf_get_insider_trades", lambda **kwargs: [])
+    monkeypatch.setattr(
+        base, "yf_get_news", SimpleNamespace(func=lambda **kwargs: {"news": []})
+    )
+    monkeypatch.setattr(
+        base,
+        "yf_get_prices_batch",
+        lambda tickers, **kwargs: {ticker: [{"close": 1.0}] for ticker in tickers},
+    )
+    monkeypatch.setattr(
+        base,
+        "yf_get_price_snapshot",
+        SimpleNamespace(
+            func=lambda tickers: {
+                ticker: {"snapshot": {"market_cap": 10.0}} for ticker in tickers
+            }
+        ),
+    )
+
+    class Agent(base.BaseFinancialAgent):
+        name = "stub"
+        required_line_items = ["revenue"]
+
+        def analyze(self, ticker, **kwargs):
+            return {"ticker": ticker}
+
+    incomplete = set()
+    results = base.run_financial_analysis(["AAPL", "FAIL"], [Agent()], incomplete)
+
+    assert results == {
+        "AAPL": {"stub": {"ticker": "AAPL"}},
+        "FAIL": {"stub": {"ticker": "FAIL"}},
+    }
+    assert incomplete == {"FAIL"}
@@ -0,0 +1,160 @@
+from datetime import date, timedelta
+
+import pytest
+
+from dexter.tools.yfinance import cache as cache_module
+from dexter.tools.yfinance.cache import (
+    LIVE_PRICES_TTL,
+    PRICES_TTL,
+    FileCache,
+    cached,
+)
+from dexter.tools.yfinance.prices import _prices_ttl
+
+
+@pytest.fixture(autouse=True)
+def enable_cache(monkeypatch):
+    monkeypatch.setenv("DEXTER_YF_CACHE", "true")
+
+
+def test_file_cache_round_trip(tmp_path):
+    file_cache = FileCache(tmp_path)
+    key = file_cache.make_key({"ticker": "AAPL", "limit": 5})
+
+    assert file_cache.get("prices", key, ttl=60) is cache_module._MISS
+
+    file_cache.set("prices", key, {"prices": [1, 2]})
+    assert file_cache.get("prices", key, ttl=60) == {"prices": [1, 2]}
+
+
+def test_file_cache_key_ignores_param_order():
+    assert FileCache.make_key({"a": 1, "b": 2}) == FileCache.make_key({"b": 2, "a": 1})
+    assert FileCache.make_key({"a": 1}) != FileCache.make_key({"a": 2})
+
+
+def test_file_cache_expires_after_ttl(tmp_path, monkeypatch):
+    file_cache = FileCache(tmp_path)
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    file_cache.set("prices", "key", "value")
+
+    now += 60
+    assert file_cache.get("prices", "key", ttl=60) == "value"
+    now += 1
+    assert file_cache.get("prices", "key", ttl=60) is cache_module._MISS
+
+
+def test_file_cache_set_replaces_entry_without_leaving_temp_files(tmp_path):
+    file_cache = FileCache(tmp_path)
+    file_cache.set("news", "key", "old")
+    file_cache.set("news", "key", "new")
+
+    assert file_cache.get("news", "key", ttl=60) == "new"
+    assert [path.name for path in (tmp_path / "news").iterdir()] == ["key.json"]
+
+
+def test_file_cache_treats_corrupt_entry_as_miss(tmp_path):
+    file_cache = FileCache(tmp_path)
+    (tmp_path / "news").mkdir()
+    (tmp_path / "news" / "key.json").write_text("{not json")
+
+    assert file_cache.get("news", "key", ttl=60) is cache_module._MISS
+
+
+def test_cached_shares_entries_between_positional_and_keyword_calls(tmp_path):
+    calls = []
+
+    @cached(endpoint="fetch", ttl=60, cache=FileCache(tmp_path))
+    def fetch(ticker: str, limit: int = 5) -> dict:
+        calls.append((ticker, limit))
+        return {"ticker": ticker, "limit": limit}
+
+    assert fetch("AAPL") == {"ticker": "AAPL", "limit": 5}
+    assert fetch("AAPL", 5) == {"ticker": "AAPL", "limit": 5}
+    assert fetch(ticker="AAPL", limit=5) == {"ticker": "AAPL", "limit": 5}
+    assert fetch("AAPL", limit=10) == {"ticker": "AAPL", "limit": 10}
+    assert calls == [("AAPL", 5), ("AAPL", 10)]
+
+
+def test_cached_normalizes_ticker_before_building_key(tmp_path):
+    calls = []
+
+    @cached(endpoint="fetch", ttl=60, cache=FileCache(tmp_path))
+    def fetch(ticker: str) -> dict:
+        calls.append(ticker)
+        return {"ticker": ticker}
+
+    assert fetch("aapl") == {"ticker": "AAPL"}
+    assert fetch(" AAPL ") == {"ticker": "AAPL"}
+    assert fetch(ticker="AAPL") == {"ticker": "AAPL"}
+    assert calls == ["AAPL"]
+    assert len(list((tmp_path / "fetch").glob("*.json"))) == 1
+
+
+def test_cached_skips_results_rejected_by_should_cache(tmp_path):
+    calls = []
+
+    @cached(
+        endpoint="fetch",
+        ttl=60,
+        cache=FileCache(tmp_path),
+        should_cache=lambda response: bool(response["prices"]),
+    )
+    def fetch(ticker: str) -> dict:
+        calls.append(ticker)
+        return {"prices": []}
+
+    fetch("AAPL")
+    fetch("AAPL")
+    assert calls == ["AAPL", "AAPL"]
+
+
+def test_cached_resolves_ttl_from_call_arguments(tmp_path, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    calls = []
+
+    @cached(
+        endpoint="fetch",
+        ttl=lambda arguments: 10 if arguments["live"] else 100,
+        cache=FileCache(tmp_path),
+    )
+    def fetch(live: bool) -> list:
+        calls.append(live)
+        return [live]
+
+    fetch(True)
+    fetch(False)
+    now += 50
+    fetch(True)
+    fetch(False)
+    assert calls == [True, False, True]
+
+
+def test_cached_bypasses_cache_when_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEXTER_YF_CACHE", "false")
+    calls = []
+
+    @cached(endpoint="fetch", ttl=60, cache=FileCache(tmp_path))
+    def fetch(ticker: str) -> list:
+        calls.append(ticker)
+        return [ticker]
+
+    fetch("AAPL")
+    fetch("AAPL")
+    assert calls == ["AAPL", "AAPL"]
+    assert not tmp_path.exists() or not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize(
+    ("interval", "end_day", "expected"),
+    [
+        ("day", date.today() - timedelta(days=30), PRICES_TTL),
+        ("day", date.today() - timedelta(days=1), LIVE_PRICES_TTL),
+        ("day", date.today(), LIVE_PRICES_TTL),
+        ("minute", date.today() - timedelta(days=30), LIVE_PRICES_TTL),
+    ],
+)
+def test_prices_ttl(interval, end_day, expected):
+    arguments = {"interval": interval, "end_date": end_day.isoformat()}
+    assert _prices_ttl(arguments) == expected
@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dexter.tools.yfinance import cache as cache_module
+from dexter.tools.yfinance import prices
+from dexter.tools.yfinance.cache import FileCache
+from dexter.tools.yfinance.prices import _perf_metrics, yf_get_prices_batch
+
+_COLUMNS = [
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Adj Close",
+    "Volume",
+    "Dividends",
+    "Stock Splits",
+]
+
+
+def _download_frame(symbols: dict[str, list[float]]) -> pd.DataFrame:
+    """Build a group_by="ticker" frame; an empty list marks a failed ticker."""
+    index = pd.DatetimeIndex(
+        ["2024-01-02 14:30", "2024-01-03 14:30", "2024-01-04 14:30"], tz="UTC"
+    )
+    frames = {}
+    for symbol, closes in symbols.items():
+        values = closes or [np.nan] * len(index)
+        frames[symbol] = pd.DataFrame(
+            {column: values for column in _COLUMNS}, index=index
+        )
+    return pd.concat(frames, axis=1, names=["Ticker", "Price"])
+
+
+@pytest.fixture
+def fake_download(monkeypatch, tmp_path):
+    monkeypatch.setenv("DEXTER_YF_CACHE", "true")
+    monkeypatch.setattr(cache_module, "_file_cache", FileCache(tmp_path))
+    calls = []
+
+    def install(frame: pd.DataFrame):
+        def download(symbols, **kwargs):
+            calls.append((symbols, kwargs))
+            return frame
+
+        monkeypatch.setattr(prices.yf, "download", download)
+        return calls
+
+    return install
+
+
+def _fetch(tickers: list[str]) -> dict[str, list[dict]]:
+    return yf_get_prices_batch(
+        tickers,
+        interval="day",
+        interval_multiplier=1,
+        start_date="2024-01-01",
+        end_date="2024-01-05",
+    )
+
+
+def test_prices_batch_splits_tickers(fake_download):
+    calls = fake_download(_download_frame({"AAPL": [1.0, 2.0, 3.0], "FAIL": []}))
+
+    result = _fetch(["aapl", "fail", "msft"])
+
+    assert calls[0][0] == ["AAPL", "FAIL", "MSFT"]
+    assert calls[0][1]["ignore_tz"] is False
+    assert [record["close"] for record in result["aapl"]] == [1.0, 2.0, 3.0]
+    assert result["aapl"][0]["timestamp"] == "2024-01-02T14:30:00+00:00"
+    assert result["fail"] == []
+    assert result["msft"] == []
+
+
+def test_prices_batch_drops_rows_where_ticker_did_not_trade(fake_download):
+    frame = _download_frame({"AAPL": [1.0, 2.0, 3.0], "D05.SI": [4.0, 5.0, 6.0]})
+    frame.loc[frame.index[1], "D05.SI"] = np.nan
+    fake_download(frame)
+
+    result = _fetch(["AAPL", "D05.SI"])
+
+    assert len(result["AAPL"]) == 3
+    assert [record["close"] for record in result["D05.SI"]] == [4.0, 6.0]
+
+
+def test_prices_batch_does_not_cache_tickers_without_rows(fake_download):
+    calls = fake_download(_download_frame({"AAPL": [1.0, 2.0, 3.0], "FAIL": []}))
+
+    _fetch(["AAPL", "FAIL"])
+    _fetch(["AAPL", "FAIL"])
+    assert len(calls) == 2
+
+
+def test_prices_batch_caches_complete_results(fake_download):
+    calls = fake_download(_download_frame({"AAPL": [1.0, 2.0, 3.0]}))
+
+    first = _fetch(["AAPL"])
+    assert _fetch(["AAPL"]) == first
+    assert len(calls) == 1
+
+
+def test_perf_metrics_matches_pandas():
+    closes = pd.Series([100.0, 110.0, 99.0, 105.0, 120.0, 90.0, 95.0])
+
+    max_drawdown, current_drawdown, volatility = _perf_metrics(closes.to_numpy(), 252.0)
+
+    drawdowns = (closes - closes.expanding().max()) / closes.expanding().max()
+    assert max_drawdown == pytest.approx(drawdowns.min())
+    assert current_drawdown == pytest.approx(drawdowns.iloc[-1])
+    assert volatility == pytest.approx(
+        closes.pct_change().dropna().std() * np.sqrt(252.0)
+    )
+
+
+def test_perf_metrics_volatility_needs_two_returns():
+    _, _, volatility = _perf_metrics(np.array([100.0, 101.0]), 252.0)
+    assert np.isnan(volatility)
+
+
+@pytest.fixture
+def fake_history(monkeypatch):
+    monkeypatch.setattr(prices, "_history_cache", prices.OrderedDict())
+    clock = [1000.0]
+    monkeypatch.setattr(prices.time, "monotonic", lambda: clock[0])
+    calls = []
+
+    def install(frame: pd.DataFrame):
+        class FakeTicker:
+            def history(self, **kwargs):
+                calls.append(kwargs)
+                return frame
+
+        monkeypatch.setattr(prices, "get_ticker", lambda ticker: FakeTicker())
+        return calls, clock
+
+    return install
+
+
+def test_load_history_does_not_cache_empty_frames(fake_history):
+    calls, _ = fake_history(pd.DataFrame())
+
+    prices._load_history("AAPL", "2024-01-01", "2024-01-05", "1d", ttl=600)
+    prices._load_history("AAPL", "2024-01-01", "2024-01-05", "1d", ttl=600)
+    assert len(calls) == 2
+
+
+def test_load_history_expires_after_ttl(fake_history):
+    calls, clock = fake_history(_download_frame({"AAPL": [1.0, 2.0, 3.0]})["AAPL"])
+    ttl = prices.LIVE_PRICES_TTL
+
+    prices._load_history("AAPL", "2024-01-01", "2024-01-05", "1d", ttl=ttl)
+    clock[0] += ttl - 1
+    prices._load_history("AAPL", "2024-01-01", "2024-01-05", "1d", ttl=ttl)
+    assert len(calls) == 1
+
+    clock[0] += 1
+    prices._load_history("AAPL", "2024-01-01", "2024-01-05", "1d", ttl=ttl)
+    assert len(calls) == 2
+
+
+def test_load_history_caps_ttl(fake_history):
+    calls, clock = fake_history(_download_frame({"AAPL": [1.0, 2.0, 3.0]})["AAPL"])
+
+    prices._load_history(
+        "AAPL", "2024-01-01", "2024-01-05", "1d", ttl=prices.PRICES_TTL
+    )
+    clock[0] += prices._HISTORY_CACHE_TTL_SECONDS
+    prices._load_history(
+        "AAPL", "2024-01-01", "2024-01-05", "1d", ttl=prices.PRICES_TTL
+    )
+    assert len(calls) == 2
@@ -0,0 +1,133 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from dexter.tools.yfinance import fundamentals
+
+WAITERS = 3
+
+
+class _StatementLoader:
+    """Stand-in for load_statement_frame that blocks until released."""
+
+    def __init__(self, error: Exception | None = None, empty: tuple[str, ...] = ()):
+        self.error = error
+        self.empty = empty
+        self.calls: list[str] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, ticker_obj, base_name, period):
+        with self._lock:
+            self.calls.append(base_name)
+        self.started.set()
+        assert self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        if base_name in self.empty:
+            return pd.DataFrame()
+        return pd.DataFrame({base_name: [1.0]})
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    fundamentals.clear_cache()
+    monkeypatch.setattr(fundamentals, "get_ticker", lambda ticker: object())
+
+    # Count the callers blocked on an in-flight fetch, so the test can
+    # release the owner only once every waiter has joined it
+    joined = threading.Semaphore(0)
+
+    class TrackingFuture(Future):
+        def result(self, timeout=None):
+            joined.release()
+            return super().result(timeout)
+
+    monkeypatch.setattr(fundamentals, "Future", TrackingFuture)
+
+    def install(
+        error: Exception | None = None, empty: tuple[str, ...] = ()
+    ) -> _StatementLoader:
+        statement_loader = _StatementLoader(error, empty)
+        monkeypatch.setattr(fundamentals, "load_statement_frame", statement_loader)
+        return statement_loader
+
+    yield install, joined
+    fundamentals.clear_cache()
+
+
+def _start_concurrent_fetches(statement_loader, joined, executor):
+    owner = executor.submit(fundamentals._fetch_statement_set, "AAPL", "annual")
+    assert statement_loader.started.wait(timeout=5)
+    waiters = [
+        executor.submit(fundamentals._fetch_statement_set, "aapl", "annual")
+        for _ in range(WAITERS)
+    ]
+    for _ in range(WAITERS):
+        assert joined.acquire(timeout=5)
+    statement_loader.release.set()
+    return owner, waiters
+
+
+def test_concurrent_misses_share_one_fetch(loader):
+    install, joined = loader
+    statement_loader = install()
+
+    with ThreadPoolExecutor(max_workers=WAITERS + 1) as executor:
+        owner, waiters = _start_concurrent_fetches(statement_loader, joined, executor)
+        frames = owner.result(timeout=5)
+        assert all(waiter.result(timeout=5) is frames for waiter in waiters)
+
+    assert sorted(statement_loader.calls) == sorted(fundamentals._STATEMENT_TYPES)
+    assert fundamentals._pending_statements == {}
+
+    # The fetched set is cached, so later loads don't hit yfinance
+    frame = fundamentals._load_cached_statement("AAPL", "cashflow", "annual")
+    assert frame is frames["cashflow"]
+    assert len(statement_loader.calls) == len(fundamentals._STATEMENT_TYPES)
+
+
+def test_owner_error_propagates_to_waiters_and_is_not_cached(loader):
+    install, joined = loader
+    error = ValueError("Yahoo throttled")
+    statement_loader = install(error)
+
+    with ThreadPoolExecutor(max_workers=WAITERS + 1) as executor:
+        owner, waiters = _start_concurrent_fetches(statement_loader, joined, executor)
+        for future in [owner, *waiters]:
+            with pytest.raises(ValueError, match="Yahoo throttled"):
+                future.result(timeout=5)
+
+    assert fundamentals._pending_statements == {}
+    assert fundamentals._statement_cache == {}
+
+    # The next miss becomes a new owner and fetches again
+    statement_loader = install()
+    statement_loader.release.set()
+    frames = fundamentals._fetch_statement_set("AAPL", "annual")
+    assert set(frames) == set(fundamentals._STATEMENT_TYPES)
+    assert len(statement_loader.calls) == len(fundamentals._STATEMENT_TYPES)
+
+
+def test_empty_statement_is_refetched_on_next_call(loader):
+    install, _ = loader
+    statement_loader = install(empty=("balance_sheet",))
+    statement_loader.release.set()
+
+    frames = fundamentals._fetch_statement_set("AAPL", "annual")
+    assert frames["balance_sheet"].empty
+    assert ("AAPL", "balance_sheet", "annual") not in fundamentals._statement_cache
+
+    # The statements that came back are served from memory, while the empty
+    # one triggers a new fetch
+    frame = fundamentals._load_cached_statement("AAPL", "income_stmt", "annual")
+    assert frame is frames["income_stmt"]
+    assert len(statement_loader.calls) == len(fundamentals._STATEMENT_TYPES)
+
+    statement_loader.empty = ()
+    frame = fundamentals._load_cached_statement("AAPL", "balance_sheet", "annual")
+    assert not frame.empty
+    assert len(statement_loader.calls) == 2 * len(fundamentals._STATEMENT_TYPES)